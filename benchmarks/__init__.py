@@ -0,0 +1,8 @@
+from .benchmark_runner import run_benchmark, default_scenarios
+from .configs import BenchmarkConfig, FakeServerConfig, ScenarioConfig
+from .fake_servers import create_fake_gotify_app, create_fake_telegram_app, serve_fake_servers
+from .results import compare_reports, save_report
+
+__all__ = ('run_benchmark', 'default_scenarios', 'BenchmarkConfig', 'FakeServerConfig', 'ScenarioConfig',
+           'create_fake_gotify_app', 'create_fake_telegram_app', 'serve_fake_servers', 'compare_reports',
+           'save_report')
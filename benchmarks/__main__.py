@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import json
+
+from .benchmark_runner import run_benchmark, default_scenarios
+from .configs import BenchmarkConfig, FakeServerConfig
+from .results import save_report, compare_reports
+
+
+def _add_fake_server_arguments(parser: argparse.ArgumentParser, name: str):
+    defaults = FakeServerConfig()
+    parser.add_argument(f'--{name}-latency', type=float, default=defaults.latency,
+                        help=f'mean latency of the fake {name} server, in seconds')
+    parser.add_argument(f'--{name}-latency-jitter', type=float, default=defaults.latency_jitter,
+                        help=f'standard deviation of the fake {name} latency, in seconds')
+    parser.add_argument(f'--{name}-error-rate', type=float, default=defaults.error_rate,
+                        help=f'fraction of {name} requests answered with HTTP 500')
+    parser.add_argument(f'--{name}-rate-limit-rate', type=float, default=defaults.rate_limit_rate,
+                        help=f'fraction of {name} requests answered with HTTP 429')
+    parser.add_argument(f'--{name}-retry-after', type=int, default=defaults.retry_after,
+                        help=f'Retry-After seconds sent with {name} 429 responses')
+
+
+def _get_fake_server_config(args: argparse.Namespace, name: str) -> FakeServerConfig:
+    name = name.replace('-', '_')
+    return FakeServerConfig(latency=getattr(args, f'{name}_latency'),
+                            latency_jitter=getattr(args, f'{name}_latency_jitter'),
+                            error_rate=getattr(args, f'{name}_error_rate'),
+                            rate_limit_rate=getattr(args, f'{name}_rate_limit_rate'),
+                            retry_after=getattr(args, f'{name}_retry_after'))
+
+
+def _parse_arguments() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Load test the notifications server against fake publishers')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the benchmark and store the results as JSON')
+    run.add_argument('--rate', type=float, default=50.0, help='requests per second for each scenario')
+    run.add_argument('--duration', type=float, default=10.0, help='seconds to run each scenario')
+    run.add_argument('--batch-size', type=int, default=10, help='notifications per batch request')
+    run.add_argument('--scenarios', default='notify,truenas-notify,notify-batch',
+                     help='comma separated scenarios to run')
+    run.add_argument('--warmup', type=float, default=2.0, help='seconds of warm-up traffic before measuring')
+    run.add_argument('--asynchronous', action='store_true', help='run the server with the delivery queue enabled')
+    run.add_argument('--rate-limits', action='store_true',
+                     help="keep the server's Telegram rate limits instead of lifting them for the fake servers")
+    run.add_argument('--output', default=None, help='result file, defaults to benchmarks/results/<version>.json')
+    _add_fake_server_arguments(run, 'gotify')
+    _add_fake_server_arguments(run, 'telegram')
+
+    compare = commands.add_parser('compare', help='compare two result files')
+    compare.add_argument('baseline')
+    compare.add_argument('candidate')
+
+    return parser.parse_args()
+
+
+def _run(args: argparse.Namespace):
+    selected = set(args.scenarios.split(','))
+    scenarios = tuple(s for s in default_scenarios(args.rate, args.duration, args.batch_size) if s.name in selected)
+    config = BenchmarkConfig(scenarios=scenarios,
+                             gotify=_get_fake_server_config(args, 'gotify'),
+                             telegram=_get_fake_server_config(args, 'telegram'),
+                             asynchronous=args.asynchronous,
+                             rate_limits=args.rate_limits,
+                             warmup=args.warmup)
+
+    report = asyncio.run(run_benchmark(config))
+    path = save_report(report, args.output)
+    print(json.dumps(report['scenarios'], indent=2))
+    print(f'RSS (MB): {report["rss_mb"]}')
+    print(f'Publish results (including warm-up): {report["publish_results"]}')
+    print(f'Results stored in {path}')
+
+
+def _compare(args: argparse.Namespace):
+    with open(args.baseline) as baseline, open(args.candidate) as candidate:
+        print('\n'.join(compare_reports(json.load(baseline), json.load(candidate))))
+
+
+if __name__ == '__main__':
+    arguments = _parse_arguments()
+    if arguments.command == 'run':
+        _run(arguments)
+    else:
+        _compare(arguments)
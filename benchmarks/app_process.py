@@ -0,0 +1,67 @@
+import asyncio
+import os
+import pathlib
+import subprocess
+import sys
+import time
+from typing import Mapping, IO
+
+import httpx
+
+_REPOSITORY_ROOT = pathlib.Path(__file__).resolve().parent.parent
+
+
+class AppProcess:
+    def __init__(self, port: int, environment: Mapping[str, str], log_file: IO[bytes] | None = None):
+        self._port = port
+        self._environment = environment
+        self._log_file = log_file
+        self._process: subprocess.Popen | None = None
+
+    @property
+    def base_url(self) -> str:
+        return f'http://127.0.0.1:{self._port}'
+
+    def start(self):
+        output = self._log_file if self._log_file is not None else subprocess.DEVNULL
+        self._process = subprocess.Popen(
+            [sys.executable, '-c', f"import main; main.build_app().run('127.0.0.1', {self._port})"],
+            cwd=_REPOSITORY_ROOT, env={**os.environ, **self._environment}, stdout=output, stderr=output)
+
+    async def wait_until_ready(self, timeout: float = 30.0):
+        deadline = time.monotonic() + timeout
+        async with httpx.AsyncClient(base_url=self.base_url) as client:
+            while time.monotonic() < deadline:
+                if self._process.poll() is not None:
+                    raise RuntimeError(f'The application exited with code {self._process.returncode}')
+                try:
+                    if (await client.get('/metrics')).status_code == 200:
+                        return
+                except httpx.TransportError:
+                    pass
+                await asyncio.sleep(0.1)
+
+        raise TimeoutError(f'The application did not start within {timeout} seconds')
+
+    def get_rss(self) -> float | None:
+        try:
+            status = pathlib.Path(f'/proc/{self._process.pid}/status').read_text()
+        except OSError:
+            return None
+
+        for line in status.splitlines():
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1]) / 1024
+
+        return None
+
+    def stop(self, timeout: float = 15.0):
+        if self._process is None or self._process.poll() is not None:
+            return
+
+        self._process.terminate()
+        try:
+            self._process.wait(timeout)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
@@ -0,0 +1,151 @@
+import asyncio
+import multiprocessing
+import re
+import socket
+import tempfile
+
+import httpx
+
+from .app_process import AppProcess
+from .configs import BenchmarkConfig, ScenarioConfig
+from .fake_servers import serve_fake_servers
+from .load_generator import run_scenario
+from .results import summarize_scenario, create_report
+
+
+_PUBLISH_RESULT_PATTERN = re.compile(
+    r'^notification_publish_results_total\{publisher="([^"]*)",result="([^"]*)"} (\S+)$', re.MULTILINE)
+
+
+def _get_free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def _run_fake_servers(*args):
+    asyncio.run(serve_fake_servers(*args))
+
+
+def _create_app_environment(config: BenchmarkConfig, gotify_port: int, telegram_port: int) -> dict[str, str]:
+    environment = {
+        'NOTIFICATIONS__Gotify__server_url': f'http://127.0.0.1:{gotify_port}',
+        'NOTIFICATIONS__Gotify__general_api_token': 'benchmark',
+        'NOTIFICATIONS__Gotify__api_token_per_source__benchmark': 'benchmark',
+        'NOTIFICATIONS__Telegram__bot_token': '1:benchmark',
+        'NOTIFICATIONS__Telegram__chat_id': '1',
+        'NOTIFICATIONS__Telegram__api_base_url': f'http://127.0.0.1:{telegram_port}/bot',
+        'NOTIFICATIONS__Delivery__asynchronous': str(config.asynchronous).lower(),
+    }
+    if not config.rate_limits:
+        for limits in ('publisher_limits', 'destination_limits'):
+            environment[f'NOTIFICATIONS__RateLimit__{limits}__telegram__rate'] = '1000000'
+            environment[f'NOTIFICATIONS__RateLimit__{limits}__telegram__burst'] = '1000000'
+
+    return environment
+
+
+class _RssSampler:
+    def __init__(self, app: AppProcess, interval: float):
+        self._app = app
+        self._interval = interval
+        self.start: float | None = None
+        self.peak: float | None = None
+        self.end: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def __enter__(self):
+        self.start = self.peak = self._app.get_rss()
+        self._task = asyncio.get_running_loop().create_task(self._sample())
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._task.cancel()
+        self.end = self._record()
+
+    async def _sample(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            self._record()
+
+    def _record(self) -> float | None:
+        rss = self._app.get_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+        return rss
+
+
+async def _warm_up(client: httpx.AsyncClient, config: BenchmarkConfig):
+    if config.warmup <= 0:
+        return
+
+    for scenario in config.scenarios:
+        await run_scenario(client, scenario._replace(name=f'warmup-{scenario.name}',
+                                                     duration=config.warmup / len(config.scenarios)))
+
+
+async def _get_publish_results(client: httpx.AsyncClient) -> dict[str, dict[str, int]]:
+    response = await client.get('/metrics')
+    publish_results: dict[str, dict[str, int]] = {}
+    for publisher, result, value in _PUBLISH_RESULT_PATTERN.findall(response.text):
+        publish_results.setdefault(publisher, {})[result] = int(float(value))
+
+    return publish_results
+
+
+async def _run_scenarios(app: AppProcess,
+                         config: BenchmarkConfig) -> tuple[dict[str, object], dict[str, object], dict[str, object]]:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=app.base_url, limits=limits, timeout=config.request_timeout) as client:
+        await _warm_up(client, config)
+
+        scenarios: dict[str, object] = {}
+        with _RssSampler(app, config.rss_sample_interval) as rss:
+            for scenario in config.scenarios:
+                print(f"Running '{scenario.name}': {scenario.rate} req/s for {scenario.duration}s")
+                scenarios[scenario.name] = summarize_scenario(await run_scenario(client, scenario))
+
+        publish_results = await _get_publish_results(client)
+
+    return scenarios, {'start': rss.start, 'peak': rss.peak, 'end': rss.end}, publish_results
+
+
+def _config_to_dict(config: BenchmarkConfig) -> dict[str, object]:
+    return {
+        **config._asdict(),
+        'scenarios': [scenario._asdict() for scenario in config.scenarios],
+        'gotify': config.gotify._asdict(),
+        'telegram': config.telegram._asdict(),
+    }
+
+
+async def run_benchmark(config: BenchmarkConfig) -> dict[str, object]:
+    gotify_port, telegram_port, app_port = _get_free_port(), _get_free_port(), _get_free_port()
+    fake_servers = multiprocessing.Process(target=_run_fake_servers, daemon=True,
+                                           args=(gotify_port, config.gotify, telegram_port, config.telegram))
+    fake_servers.start()
+
+    with tempfile.TemporaryFile() as log_file:
+        app = AppProcess(app_port, _create_app_environment(config, gotify_port, telegram_port), log_file)
+        app.start()
+        try:
+            await app.wait_until_ready()
+            scenarios, rss_mb, publish_results = await _run_scenarios(app, config)
+        except Exception:
+            log_file.seek(0)
+            print(log_file.read().decode(errors='replace')[-4000:])
+            raise
+        finally:
+            app.stop()
+            fake_servers.terminate()
+            fake_servers.join()
+
+    return create_report(_config_to_dict(config), scenarios, rss_mb, publish_results)
+
+
+def default_scenarios(rate: float, duration: float, batch_size: int) -> tuple[ScenarioConfig, ...]:
+    return (
+        ScenarioConfig('notify', '/notify', rate, duration),
+        ScenarioConfig('truenas-notify', '/truenas-notify', rate, duration),
+        ScenarioConfig('notify-batch', '/notify/batch', max(1.0, rate / batch_size), duration, batch_size),
+    )
@@ -0,0 +1,28 @@
+from typing import NamedTuple
+
+
+class FakeServerConfig(NamedTuple):
+    latency: float = 0.02
+    latency_jitter: float = 0.005
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after: int = 1
+
+
+class ScenarioConfig(NamedTuple):
+    name: str
+    route: str
+    rate: float
+    duration: float
+    batch_size: int = 0
+
+
+class BenchmarkConfig(NamedTuple):
+    scenarios: tuple[ScenarioConfig, ...]
+    gotify: FakeServerConfig = FakeServerConfig()
+    telegram: FakeServerConfig = FakeServerConfig()
+    asynchronous: bool = False
+    rate_limits: bool = False
+    warmup: float = 2.0
+    rss_sample_interval: float = 0.25
+    request_timeout: float = 30.0
@@ -0,0 +1,82 @@
+import asyncio
+import random
+import time
+
+import uvicorn
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+from .configs import FakeServerConfig
+
+
+class _FakeBehaviour:
+    def __init__(self, config: FakeServerConfig):
+        self._config = config
+        self.requests = 0
+
+    async def respond(self) -> str:
+        self.requests += 1
+        config = self._config
+        await asyncio.sleep(max(0.0, random.gauss(config.latency, config.latency_jitter)))
+
+        roll = random.random()
+        if roll < config.rate_limit_rate:
+            return 'rate_limited'
+        if roll < config.rate_limit_rate + config.error_rate:
+            return 'error'
+        return 'ok'
+
+
+def create_fake_gotify_app(config: FakeServerConfig) -> Starlette:
+    behaviour = _FakeBehaviour(config)
+
+    async def post_message(request: Request):
+        await request.body()
+        match await behaviour.respond():
+            case 'rate_limited':
+                return JSONResponse({'error': 'Too Many Requests', 'errorCode': 429}, status_code=429,
+                                    headers={'Retry-After': str(config.retry_after)})
+            case 'error':
+                return JSONResponse({'error': 'Internal Server Error', 'errorCode': 500}, status_code=500)
+
+        return JSONResponse({'id': behaviour.requests, 'appid': 1, 'date': time.strftime('%Y-%m-%dT%H:%M:%SZ')})
+
+    return Starlette(routes=[Route('/message', post_message, methods=['POST'])])
+
+
+def create_fake_telegram_app(config: FakeServerConfig) -> Starlette:
+    behaviour = _FakeBehaviour(config)
+
+    async def call_method(request: Request):
+        await request.body()
+        method = request.path_params['method']
+        if method == 'getMe':
+            return JSONResponse({'ok': True, 'result': {'id': 1, 'is_bot': True, 'first_name': 'Benchmark',
+                                                        'username': 'benchmark_bot'}})
+
+        match await behaviour.respond():
+            case 'rate_limited':
+                return JSONResponse({'ok': False, 'error_code': 429,
+                                     'description': f'Too Many Requests: retry after {config.retry_after}',
+                                     'parameters': {'retry_after': config.retry_after}}, status_code=429)
+            case 'error':
+                return JSONResponse({'ok': False, 'error_code': 500, 'description': 'Internal Server Error'},
+                                    status_code=500)
+
+        return JSONResponse({'ok': True, 'result': {'message_id': behaviour.requests, 'date': int(time.time()),
+                                                    'chat': {'id': 1, 'type': 'private'}, 'text': ''}})
+
+    return Starlette(routes=[Route('/bot{token}/{method}', call_method, methods=['GET', 'POST'])])
+
+
+async def serve_fake_servers(gotify_port: int, gotify_config: FakeServerConfig,
+                             telegram_port: int, telegram_config: FakeServerConfig):
+    servers = [
+        uvicorn.Server(uvicorn.Config(create_fake_gotify_app(gotify_config), host='127.0.0.1', port=gotify_port,
+                                      log_level='warning', access_log=False)),
+        uvicorn.Server(uvicorn.Config(create_fake_telegram_app(telegram_config), host='127.0.0.1',
+                                      port=telegram_port, log_level='warning', access_log=False)),
+    ]
+    await asyncio.gather(*(server.serve() for server in servers))
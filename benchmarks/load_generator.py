@@ -0,0 +1,62 @@
+import asyncio
+import collections
+import time
+from typing import Callable, NamedTuple
+
+import httpx
+
+from .configs import ScenarioConfig
+
+
+class ScenarioSamples(NamedTuple):
+    scenario: ScenarioConfig
+    latencies: list[float]
+    status_codes: collections.Counter[str]
+    elapsed: float
+
+
+def _notification(scenario: ScenarioConfig, i: int) -> dict[str, str]:
+    return {'source': 'benchmark', 'title': f'{scenario.name} #{i}', 'severity': 'info',
+            'message': f'Benchmark notification {i} of scenario {scenario.name}'}
+
+
+def _create_payload_factory(scenario: ScenarioConfig) -> Callable[[int], object]:
+    if scenario.batch_size > 0:
+        return lambda i: [_notification(scenario, i * scenario.batch_size + j) for j in range(scenario.batch_size)]
+    if scenario.route == '/truenas-notify':
+        return lambda i: {'text': f'Benchmark alert {i} of scenario {scenario.name}'}
+
+    return lambda i: _notification(scenario, i)
+
+
+async def _send(client: httpx.AsyncClient, route: str, payload: object, scheduled_time: float,
+                latencies: list[float], status_codes: collections.Counter[str]):
+    try:
+        response = await client.post(route, json=payload)
+        status_codes[str(response.status_code)] += 1
+    except httpx.HTTPError as e:
+        status_codes[type(e).__name__] += 1
+
+    latencies.append(time.perf_counter() - scheduled_time)
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario: ScenarioConfig) -> ScenarioSamples:
+    create_payload = _create_payload_factory(scenario)
+    latencies: list[float] = []
+    status_codes: collections.Counter[str] = collections.Counter()
+    interval = 1 / scenario.rate
+    request_count = int(scenario.rate * scenario.duration)
+    tasks: list[asyncio.Task] = []
+
+    start_time = time.perf_counter()
+    for i in range(request_count):
+        scheduled_time = start_time + i * interval
+        delay = scheduled_time - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        tasks.append(asyncio.create_task(
+            _send(client, scenario.route, create_payload(i), scheduled_time, latencies, status_codes)))
+
+    await asyncio.gather(*tasks)
+    return ScenarioSamples(scenario, latencies, status_codes, time.perf_counter() - start_time)
@@ -0,0 +1,102 @@
+import json
+import math
+import pathlib
+import platform
+import subprocess
+import time
+from typing import Sequence, Mapping
+
+from .load_generator import ScenarioSamples
+
+_REPOSITORY_ROOT = pathlib.Path(__file__).resolve().parent.parent
+_COMPARED_METRICS = (('latency_ms', 'p50'), ('latency_ms', 'p95'), ('latency_ms', 'p99'), ('throughput', None))
+
+
+def percentile(sorted_values: Sequence[float], p: float) -> float:
+    if not sorted_values:
+        return math.nan
+
+    rank = max(0, math.ceil(p / 100 * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+def summarize_scenario(samples: ScenarioSamples) -> dict[str, object]:
+    latencies = sorted(samples.latencies)
+    successful = sum(count for status, count in samples.status_codes.items() if status.startswith('2'))
+    items_per_request = max(1, samples.scenario.batch_size)
+
+    return {
+        'route': samples.scenario.route,
+        'target_rate': samples.scenario.rate,
+        'duration': round(samples.elapsed, 3),
+        'requests': len(latencies),
+        'successful_requests': successful,
+        'status_codes': dict(samples.status_codes),
+        'throughput': round(successful / samples.elapsed, 3) if samples.elapsed > 0 else 0.0,
+        'notifications_per_second': round(successful * items_per_request / samples.elapsed, 3)
+        if samples.elapsed > 0 else 0.0,
+        'latency_ms': {
+            'p50': round(percentile(latencies, 50) * 1000, 3),
+            'p95': round(percentile(latencies, 95) * 1000, 3),
+            'p99': round(percentile(latencies, 99) * 1000, 3),
+            'max': round(latencies[-1] * 1000, 3) if latencies else math.nan,
+            'mean': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else math.nan,
+        },
+    }
+
+
+def get_version() -> str:
+    try:
+        return subprocess.run(['git', 'describe', '--always', '--dirty'], cwd=_REPOSITORY_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def create_report(config: Mapping[str, object], scenarios: Mapping[str, object],
+                  rss_mb: Mapping[str, float | None],
+                  publish_results: Mapping[str, Mapping[str, int]]) -> dict[str, object]:
+    return {
+        'version': get_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'config': config,
+        'scenarios': scenarios,
+        'rss_mb': rss_mb,
+        'publish_results': publish_results,
+    }
+
+
+def save_report(report: Mapping[str, object], output_path: str | None) -> pathlib.Path:
+    if output_path is None:
+        file_name = f"{report['version']}-{time.strftime('%Y%m%d-%H%M%S')}.json"
+        path = _REPOSITORY_ROOT / 'benchmarks' / 'results' / file_name
+    else:
+        path = pathlib.Path(output_path)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2))
+    return path
+
+
+def compare_reports(baseline: Mapping[str, object], candidate: Mapping[str, object]) -> list[str]:
+    lines = [f"{'scenario':<16} {'metric':<12} {baseline['version']:>14} {candidate['version']:>14} {'change':>9}"]
+    for name, baseline_scenario in baseline['scenarios'].items():
+        candidate_scenario = candidate['scenarios'].get(name, None)
+        if candidate_scenario is None:
+            continue
+
+        for group, key in _COMPARED_METRICS:
+            old = baseline_scenario[group] if key is None else baseline_scenario[group][key]
+            new = candidate_scenario[group] if key is None else candidate_scenario[group][key]
+            change = f'{(new - old) / old * 100:+.1f}%' if old else 'n/a'
+            lines.append(f"{name:<16} {key or group:<12} {old:>14.3f} {new:>14.3f} {change:>9}")
+
+    for key in ('peak', 'end'):
+        old, new = baseline['rss_mb'].get(key), candidate['rss_mb'].get(key)
+        if old is not None and new is not None:
+            lines.append(f"{'rss':<16} {key + '_mb':<12} {old:>14.3f} {new:>14.3f} "
+                         f"{f'{(new - old) / old * 100:+.1f}%':>9}")
+
+    return lines
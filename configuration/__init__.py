@@ -1,5 +1,8 @@
 from .configuration_container_builder import ConfigurationContainerBuilder
+from .configuration_watcher import ConfigurationWatcher
 from .empty_section import EmptySection
-from .interfaces import IConfigurationSection
+from .interfaces import IConfigurationSection, IOptionsMonitor
+from .options_monitor import OptionsMonitor
 
-__all__ = ('ConfigurationContainerBuilder', 'IConfigurationSection', 'EmptySection')
+__all__ = ('ConfigurationContainerBuilder', 'IConfigurationSection', 'EmptySection', 'IOptionsMonitor',
+           'OptionsMonitor', 'ConfigurationWatcher')
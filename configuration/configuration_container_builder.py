@@ -1,24 +1,33 @@
-from typing import Self
+from typing import Self, Callable
 
 from dependency_injection import DependencyContainerBuilder
 from .configuration_section import ConfigurationSection
+from .configuration_watcher import ConfigurationWatcher
 from .constants import ROOT_PATH
 from .data_holder import DataHolder
 from .data_providers import DataProvider
-from .interfaces import IConfigurationSection
+from .interfaces import IConfigurationSection, IOptionsMonitor
+from .options_monitor import OptionsMonitor
 
 
 class ConfigurationContainerBuilder:
-    def __init__(self, di_builder: DependencyContainerBuilder):
+    def __init__(self, di_builder: DependencyContainerBuilder, watch_interval: float = 1.0):
         self._di_builder = di_builder
         self._data_providers: list[DataProvider] = []
-        data_holder = DataHolder(self._data_providers)
-        self._root_section = ConfigurationSection(data_holder, ROOT_PATH)
+        self._data_holder = DataHolder(self._data_providers)
+        self._root_section = ConfigurationSection(self._data_holder, ROOT_PATH)
+
+        watcher = ConfigurationWatcher(self._data_holder, watch_interval)
+        self._di_builder.add_singleton(ConfigurationWatcher, instantiation_method=lambda _: watcher)
 
     def add_provider(self, data_provider: DataProvider) -> Self:
         self._data_providers.append(data_provider)
         return self
 
+    def add_reload_listener(self, listener: Callable[[], None]) -> Self:
+        self._data_holder.add_reload_listener(listener)
+        return self
+
     def get[T](self, t: type[T]) -> T | None:
         return self._root_section.get(t)
 
@@ -28,6 +37,13 @@ class ConfigurationContainerBuilder:
     def get_required_section(self, path: str) -> IConfigurationSection:
         return self._root_section.get_required_section(path)
 
-    def configure[T](self, path: IConfigurationSection, t: type[T]) -> Self:
-        self._di_builder.add_singleton(t, instantiation_method=lambda _: path.get(t))
+    def configure[T](self, path: IConfigurationSection, t: type[T], default: T | None = None) -> Self:
+        def create_monitor(_) -> IOptionsMonitor[T]:
+            return OptionsMonitor(self._data_holder, path.path, t, default)
+
+        def get_value(service_provider) -> T | None:
+            return service_provider.get_required_service(IOptionsMonitor[t]).current_value
+
+        self._di_builder.add_singleton(IOptionsMonitor[t], OptionsMonitor, instantiation_method=create_monitor)
+        self._di_builder.add_singleton(t, instantiation_method=get_value)
         return self
@@ -10,6 +10,10 @@ class ConfigurationSection:
         self._data = sub_data
         self._path = path
 
+    @property
+    def path(self) -> str:
+        return self._path
+
     def get[T](self, t: type[T]) -> T | None:
         return self._data.get_value(self._path, t)
 
@@ -0,0 +1,31 @@
+import asyncio
+
+from .data_holder import DataHolder
+
+
+class ConfigurationWatcher:
+    def __init__(self, data_holder: DataHolder, interval: float = 1.0):
+        self._data_holder = data_holder
+        self._interval = interval
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        self._data_holder.set_watched(True)
+        self._task = asyncio.create_task(self._watch())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        self._data_holder.set_watched(False)
+
+    async def _watch(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            try:
+                if self._data_holder.refresh():
+                    print(f'Configuration reloaded, version {self._data_holder.version}')
+            except Exception as e:
+                print(f'Failed to reload the configuration: {e}')
@@ -0,0 +1,179 @@
+import functools
+import inspect
+import re
+from typing import Callable, get_args, NoReturn
+
+from .data_constructor import construct_object
+from .data_validator import validate_data
+from .exceptions import UnexpectedConstructorParametersError, MissingConstructorParametersError, ConfigurationException
+from .type_utils import DataType, PRIMITIVE_TYPES
+from .type_utils import unwrap_optional, get_base_class, get_constructor_annotated_parameters, \
+    get_constructor_type_hints, is_primitive_type
+
+type DataParser[T] = Callable[[DataType], T]
+
+_sentinel = object()
+_FLOAT_PATTERN = re.compile(r'^[+-]?\d+(\.\d+)?$')
+_KEYWORD_PARAMETER_KINDS = (inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.KEYWORD_ONLY)
+_PRIMITIVE_VALIDATORS: dict[type, Callable[[str], bool]] = {
+    int: lambda s: s.isdigit() or s[1:].isdigit(),
+    float: lambda s: _FLOAT_PATTERN.match(s) is not None,
+    bool: lambda s: s.lower() in ('true', 'false', '1', '0', 'yes', 'no'),
+}
+
+
+@functools.cache
+def compile_parser[T](t: type[T]) -> DataParser[T]:
+    base = unwrap_optional(t)
+    if base is not t:
+        return _compile_optional(base)
+
+    origin = get_base_class(t)
+    if inspect.isclass(origin) and issubclass(origin, list):
+        return _compile_list(t)
+    if is_primitive_type(t):
+        return _compile_primitive(t)
+    if inspect.isclass(origin) and issubclass(origin, dict):
+        return _compile_dict(t)
+    if inspect.isclass(t):
+        return _compile_object(t)
+
+    return _compile_fallback(t)
+
+
+def _compile_optional[T](t: type[T]) -> DataParser[T | None]:
+    parse = compile_parser(t)
+
+    def parse_optional(data: DataType) -> T | None:
+        return None if data is None else parse(data)
+
+    return parse_optional
+
+
+def _compile_list[T](t: type[list[T]]) -> DataParser[list[T]]:
+    args = get_args(t)
+    parse_item = compile_parser(args[0] if args else object)
+    name = t.__name__
+
+    def parse_list(data: DataType) -> list[T]:
+        if not isinstance(data, list):
+            _raise_type_mismatch(data, (list,))
+
+        items = []
+        for i, item in enumerate(data):
+            try:
+                items.append(parse_item(item))
+            except (TypeError, ConfigurationException) as e:
+                raise TypeError(f"At index '{i}' of {name}: {e}") from e
+
+        return items
+
+    return parse_list
+
+
+def _compile_dict[T](t: type[dict[str, T]]) -> DataParser[dict[str, T]]:
+    args = get_args(t)
+    parse_item = compile_parser(args[1] if args else object)
+    name = t.__name__
+
+    def parse_dict(data: DataType) -> dict[str, T]:
+        if not isinstance(data, dict):
+            _raise_type_mismatch(data, (dict,))
+
+        items = {}
+        for key, item in data.items():
+            try:
+                items[key] = parse_item(item)
+            except (TypeError, ConfigurationException) as e:
+                raise TypeError(f"In key {key} of {name}: {e}") from e
+
+        return items
+
+    return parse_dict
+
+
+def _compile_object[T](t: type[T]) -> DataParser[T]:
+    params = get_constructor_annotated_parameters(t)
+    if any(p.kind == inspect.Parameter.POSITIONAL_ONLY for p in params):
+        return _compile_fallback(t)
+
+    hints = get_constructor_type_hints(t)
+    fields = tuple((p.name, compile_parser(hints.get(p.name, p.annotation)))
+                   for p in params if p.kind in _KEYWORD_PARAMETER_KINDS)
+    required_params = frozenset(p.name for p in params if p.default is p.empty and p.kind in _KEYWORD_PARAMETER_KINDS)
+    valid_params = frozenset(name for name, _ in fields)
+    has_kwargs = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in params)
+    name = t.__name__
+
+    def parse_object(data: DataType) -> T:
+        if not isinstance(data, dict):
+            _raise_type_mismatch(data, (dict,))
+
+        keys = data.keys()
+        if not required_params <= keys:
+            raise MissingConstructorParametersError(t, set(required_params - keys))
+        if not has_kwargs and not keys <= valid_params:
+            raise UnexpectedConstructorParametersError(t, set(keys - valid_params))
+
+        kwargs = {}
+        for field_name, parse_field in fields:
+            value = data.get(field_name, _sentinel)
+            if value is _sentinel:
+                continue
+
+            try:
+                kwargs[field_name] = parse_field(value)
+            except (TypeError, ConfigurationException) as e:
+                raise TypeError(f"In field '{field_name}' of {name}: {e}") from e
+
+        return t(**kwargs)
+
+    return parse_object
+
+
+def _compile_primitive[T](t: type[T]) -> DataParser[T]:
+    if issubclass(t, str):
+        def parse_str(data: DataType) -> T:
+            if not isinstance(data, PRIMITIVE_TYPES):
+                _raise_type_mismatch(data, PRIMITIVE_TYPES)
+            return data if type(data) is t else t(data)
+
+        return parse_str
+
+    validator = _PRIMITIVE_VALIDATORS.get(t, None)
+
+    def parse_primitive(data: DataType) -> T:
+        if type(data) is t:
+            return data
+        if not isinstance(data, PRIMITIVE_TYPES):
+            _raise_type_mismatch(data, PRIMITIVE_TYPES)
+        if isinstance(data, t):
+            return t(data)
+        if not isinstance(data, str):
+            if t is float and isinstance(data, int):
+                return t(data)
+            raise TypeError(f"Can't parse '{data}' to type {t.__name__}, invalid input")
+        if validator is None:
+            raise TypeError(f"Can't parse '{data}' to type {t.__name__}, unknown parser")
+
+        stripped = data.strip()
+        if len(stripped) == 0 or not validator(stripped):
+            raise TypeError(f"Can't parse '{data}' to type {t.__name__}, invalid input")
+
+        if t is bool:
+            return data.lower() in ('true', '1', 'yes')
+        return t(data)
+
+    return parse_primitive
+
+
+def _compile_fallback[T](t: type[T]) -> DataParser[T]:
+    def parse(data: DataType) -> T:
+        validate_data(data, t)
+        return construct_object(data, t)
+
+    return parse
+
+
+def _raise_type_mismatch(data: DataType, expected_types: tuple[type, ...]) -> NoReturn:
+    raise TypeError(f"Expected {', '.join(x.__name__ for x in expected_types)}, got '{type(data).__name__}'")
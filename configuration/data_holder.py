@@ -1,10 +1,10 @@
 from __future__ import annotations
 
-from typing import Sequence, Mapping
+import time
+from typing import Sequence, Mapping, Callable
 
-from .data_constructor import construct_object
+from .data_compiler import compile_parser
 from .data_providers import DataProvider
-from .data_validator import validate_data
 from .type_utils import DataType
 from .constants import ROOT_PATH, PATH_DELIMITER
 
@@ -12,55 +12,137 @@ _sentinel = object()
 
 
 class DataHolder:
-    def __init__(self, data_providers: Sequence[DataProvider]):
+    def __init__(self, data_providers: Sequence[DataProvider], refresh_interval: float = 1.0):
         self._data_providers = data_providers
-        self._data: dict[str, DataType] = {}
+        self._refresh_interval = refresh_interval
+        self._next_refresh_check = 0.0
+        self._layers: list[Mapping[str, DataType]] = []
+        self._merged_layers: list[Mapping[str, DataType]] = []
+        self._data: Mapping[str, DataType] = {}
+        self._version = 0
+        self._sub_data_index: dict[str, DataType] = {}
+        self._values: dict[tuple[str, type], object] = {}
+        self._watched = False
+        self._reload_listeners: list[Callable[[], None]] = []
+
+    @property
+    def version(self) -> int:
+        self._refresh_data()
+        return self._version
 
     def get_value[T](self, path: str, t: type[T]) -> T | None:
         self._refresh_data()
-        sub_data = self._get_sub_data(path)
 
-        if sub_data is _sentinel:
-            return None
+        key = (path, t)
+        value = self._values.get(key, _sentinel)
+        if value is _sentinel:
+            value = self._values[key] = self._construct_value(path, t)
 
-        validate_data(sub_data, t)
-        return construct_object(sub_data, t)
+        return value
 
     def is_valid_path(self, path: str):
         self._refresh_data()
-
+        return self._get_sub_data(path) is not _sentinel
+
+    def add_reload_listener(self, listener: Callable[[], None]):
+        self._reload_listeners.append(listener)
+
+    def set_watched(self, watched: bool):
+        self._watched = watched
+
+    def refresh(self) -> bool:
+        initial_load = not self._layers
+        first_changed_layer = None
+        for i, provider in enumerate(self._data_providers):
+            if i >= len(self._layers):
+                self._layers.append(provider.load(True))
+            elif provider.reload_required():
+                self._layers[i] = provider.load(True)
+            else:
+                continue
+
+            if first_changed_layer is None:
+                first_changed_layer = i
+
+        if first_changed_layer is None:
+            return False
+
+        del self._merged_layers[first_changed_layer:]
+        data = self._merged_layers[-1] if self._merged_layers else {}
+        for layer in self._layers[first_changed_layer:]:
+            data = _merge(data, layer)
+            self._merged_layers.append(data)
+
+        previous_index = self._sub_data_index
+        self._data = data
+        self._sub_data_index = {}
+        self._values = {key: value for key, value in self._values.items()
+                        if self._get_sub_data(key[0]) is previous_index.get(key[0])}
+        self._version += 1
+
+        if initial_load:
+            return True
+
+        for listener in tuple(self._reload_listeners):
+            try:
+                listener()
+            except Exception as e:
+                print(f"Configuration reload listener failed: {e}")
+
+        return True
+
+    def _construct_value[T](self, path: str, t: type[T]) -> T | None:
         sub_data = self._get_sub_data(path)
-        return sub_data is not _sentinel
 
-    def _get_sub_data(self, path: str) -> DataType | type(_sentinel):
-        sub_data = self._data
-
-        if path is ROOT_PATH:
-            return sub_data
+        if sub_data is _sentinel:
+            return None
 
-        path_sections = path.split(PATH_DELIMITER)
+        return compile_parser(t)(sub_data)
 
-        for section in path_sections:
-            if not isinstance(sub_data, Mapping):
-                return _sentinel
-            sub_data = sub_data.get(section, _sentinel)
-            if sub_data is _sentinel:
-                return _sentinel
+    def _get_sub_data(self, path: str) -> DataType:
+        sub_data = self._sub_data_index.get(path, _sentinel)
+        if sub_data is _sentinel:
+            sub_data = self._sub_data_index[path] = _find_sub_data(self._data, path)
 
         return sub_data
 
     def _refresh_data(self):
-        if not any(provider.reload_required() for provider in self._data_providers):
+        if self._watched:
             return
 
-        self._data.clear()
-        for provider in self._data_providers:
-            _deep_update(self._data, provider.load(provider.reload_required()))
+        now = time.monotonic()
+        if now < self._next_refresh_check:
+            return
 
-def _deep_update(d, u):
-    for k, v in u.items():
-        if isinstance(v, dict) and isinstance(d.setdefault(k, {}), dict):
-            _deep_update(d[k], v)
+        self._next_refresh_check = now + self._refresh_interval
+        self.refresh()
+
+
+def _find_sub_data(data: Mapping[str, DataType], path: str) -> DataType:
+    if path == ROOT_PATH:
+        return data
+
+    sub_data = data
+    for key in path.split(PATH_DELIMITER):
+        if not isinstance(sub_data, Mapping):
+            return _sentinel
+        sub_data = sub_data.get(key, _sentinel)
+        if sub_data is _sentinel:
+            return _sentinel
+
+    return sub_data
+
+
+def _merge(base: Mapping[str, DataType], overlay: Mapping[str, DataType]) -> Mapping[str, DataType]:
+    if not overlay:
+        return base
+
+    merged = dict(base)
+    for key, value in overlay.items():
+        base_value = merged.get(key, None)
+        if isinstance(value, Mapping) and isinstance(base_value, Mapping):
+            merged[key] = _merge(base_value, value)
         else:
-            d[k] = v
-    return d
+            merged[key] = value
+
+    return merged
@@ -1,4 +1,6 @@
 from .data_provider import DataProvider
-from .file_data_provider import FileDataProvider, FileType, json_file, dot_env_file
+from .environment_data_provider import EnvironmentDataProvider, environment_variables
+from .file_data_provider import FileDataProvider, FileType, json_file, toml_file, dot_env_file
 
-__all__ = ('DataProvider', 'FileDataProvider', 'FileType', 'json_file', 'dot_env_file')
+__all__ = ('DataProvider', 'FileDataProvider', 'FileType', 'json_file', 'toml_file', 'dot_env_file',
+           'EnvironmentDataProvider', 'environment_variables')
@@ -0,0 +1,34 @@
+import os
+
+from configuration.type_utils import DataType
+from .data_provider import DataProvider
+from .file_data_provider.dot_env_data_loader import insert_element
+
+
+class EnvironmentDataProvider(DataProvider):
+    def __init__(self, prefix: str = '', delimiter: str = '__'):
+        super().__init__()
+        self._prefix = prefix
+        self._delimiter = delimiter
+        self._variables: dict[str, str] | None = None
+
+    def _load_data(self) -> dict[str, DataType]:
+        self._variables = self._get_variables()
+        result: dict[str, DataType] = {}
+
+        for key, value in self._variables.items():
+            insert_element(key, value, result, self._delimiter)
+
+        return result
+
+    def _reload_required(self) -> bool:
+        return self._variables != self._get_variables()
+
+    def _get_variables(self) -> dict[str, str]:
+        prefix_length = len(self._prefix)
+        return {key[prefix_length:]: value for key, value in os.environ.items()
+                if key.startswith(self._prefix) and len(key) > prefix_length}
+
+
+def environment_variables(prefix: str = '', delimiter: str = '__') -> DataProvider:
+    return EnvironmentDataProvider(prefix, delimiter)
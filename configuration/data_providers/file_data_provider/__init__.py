@@ -1,4 +1,5 @@
 import json
+import tomllib
 
 from dotenv import find_dotenv
 
@@ -14,4 +15,8 @@ def json_file(json_path: str) -> DataProvider:
     return FileDataProvider(json_path, json.load)
 
 
-__all__ = ('FileDataProvider', 'FileType', 'json_file', 'dot_env_file')
+def toml_file(toml_path: str) -> DataProvider:
+    return FileDataProvider(toml_path, tomllib.load, FileType.Binary)
+
+
+__all__ = ('FileDataProvider', 'FileType', 'json_file', 'toml_file', 'dot_env_file')
@@ -5,8 +5,8 @@ from dotenv import dotenv_values
 from configuration.type_utils import DataType
 
 
-def _insert_element(key: str, value: str, d: dict[str, DataType]):
-    segments = key.split('__')
+def insert_element(key: str, value: str, d: dict[str, DataType], delimiter: str = '__'):
+    segments = key.split(delimiter)
     current = d
     for key in segments[:-1]:
         current = current.setdefault(key, {})
@@ -18,6 +18,6 @@ def load_dot_env_file(fp: IO[str | bytes | Any]) -> dict[str, DataType]:
     result: dict[str, DataType] = {}
 
     for key, value in env.items():
-        _insert_element(key, value, result)
+        insert_element(key, value, result)
 
     return result
@@ -23,16 +23,27 @@ class FileDataProvider(DataProvider):
         self._file_type = file_type
         self._data_loader = data_loader
         self._last_modified_time: float | None = None
+        self._loaded = False
 
     def _load_data(self) -> dict[str, DataType]:
-        if self._file is None or not self._file.exists():
+        self._loaded = True
+        self._last_modified_time = self._get_modified_time()
+        if self._last_modified_time is None:
             return {}
 
-        self._last_modified_time = self._file.stat().st_mtime
         with open(self._file, self._file_type) as fp:
             return self._data_loader(fp)
 
     def _reload_required(self) -> bool:
         if self._file is None:
             return False
-        return self._last_modified_time is None or self._last_modified_time < self._file.stat().st_mtime
+        return not self._loaded or self._last_modified_time != self._get_modified_time()
+
+    def _get_modified_time(self) -> float | None:
+        if self._file is None:
+            return None
+
+        try:
+            return self._file.stat().st_mtime
+        except FileNotFoundError:
+            return None
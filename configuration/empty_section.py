@@ -7,6 +7,10 @@ class EmptySection:
     def __init__(self, path: str):
         self._path = path
 
+    @property
+    def path(self) -> str:
+        return self._path
+
     def get[T](self, _: type[T]) -> T | None:
         return None
 
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Protocol, Callable
 
 
 class IConfigurationSection(Protocol):
+    @property
+    def path(self) -> str:
+        ...
+
     def get[T](self, t: type[T]) -> T | None:
         ...
 
@@ -12,3 +16,12 @@ class IConfigurationSection(Protocol):
 
     def get_required_section(self, path: str) -> IConfigurationSection:
         ...
+
+
+class IOptionsMonitor[T](Protocol):
+    @property
+    def current_value(self) -> T | None:
+        ...
+
+    def on_change(self, listener: Callable[[T | None], None]) -> Callable[[], None]:
+        ...
@@ -0,0 +1,43 @@
+from typing import Callable
+
+from .data_holder import DataHolder
+
+
+class OptionsMonitor[T]:
+    def __init__(self, data_holder: DataHolder, path: str, t: type[T], default: T | None = None):
+        self._data_holder = data_holder
+        self._path = path
+        self._type = t
+        self._default = default
+        self._listeners: list[Callable[[T | None], None]] = []
+        self._current_value = self._load()
+        data_holder.add_reload_listener(self._on_reload)
+
+    @property
+    def current_value(self) -> T | None:
+        return self._current_value
+
+    def on_change(self, listener: Callable[[T | None], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def _load(self) -> T | None:
+        value = self._data_holder.get_value(self._path, self._type)
+        return self._default if value is None else value
+
+    def _on_reload(self):
+        try:
+            value = self._load()
+        except Exception as e:
+            print(f"Keeping the previous '{self._type.__name__}', the reloaded configuration is invalid: {e}")
+            return
+
+        if value == self._current_value:
+            return
+
+        self._current_value = value
+        for listener in tuple(self._listeners):
+            try:
+                listener(value)
+            except Exception as e:
+                print(f"Listener for '{self._type.__name__}' changes failed: {e}")
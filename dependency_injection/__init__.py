@@ -1,6 +1,7 @@
 from .dependency_container_builder import DependencyContainerBuilder
 from .interfaces import IServiceProvider, IServiceScopeFactory, IServiceScope, IDependencyContainer, \
     IServiceRegistrationHandler
+from .models import LifeScope
 
 __all__ = ('IDependencyContainer', 'DependencyContainerBuilder', 'IServiceProvider', 'IServiceScope',
-           'IServiceScopeFactory', 'IServiceRegistrationHandler')
+           'IServiceScopeFactory', 'IServiceRegistrationHandler', 'LifeScope')
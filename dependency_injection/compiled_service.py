@@ -0,0 +1,16 @@
+from typing import Callable
+
+from .models import RegisteredService, ServiceIdentifier
+
+
+class CompiledService:
+    __slots__ = ('service', 'life_scope', 'key', 'create', 'dependencies', 'dynamic_dependencies', 'error')
+
+    def __init__(self, identifier: ServiceIdentifier, service: RegisteredService):
+        self.service = service
+        self.life_scope = service.life_scope
+        self.key = (identifier, service.implementation_type)
+        self.create: Callable[[object], object] | None = None
+        self.dependencies: tuple[CompiledService, ...] = ()
+        self.dynamic_dependencies = False
+        self.error: Exception | None = None
@@ -1,29 +1,79 @@
 import contextlib
-from typing import Mapping, Generator, Sequence
+from typing import Mapping, Generator, Sequence, AsyncGenerator, NoReturn
 
-from .exceptions import UnregisteredTypeError
-from .interfaces import InstantiationMethodType, IServiceScope
-from .models import RegisteredService, ServiceIdentifier
+from tracing import start_span
+from .exceptions import UnregisteredTypeError, AsyncServiceNotInitializedError
+from .interfaces import InstantiationMethodType, IServiceScope, IServiceScopeFactory, AsyncInstantiationMethodType, \
+    IServiceProvider
+from .models import RegisteredService, ServiceIdentifier, LifeScope
 from .scoped_service_provider import ScopedServiceProvider
-from .service_constructor import ServiceConstructor
+from .service_compiler import compile_services
+from .service_validator import validate_services
 
 
 class DependencyContainer:
     def __init__(self, registered_services: Mapping[ServiceIdentifier, Sequence[RegisteredService]],
-                 custom_instantiation_methods: Mapping[tuple[ServiceIdentifier, type], InstantiationMethodType]):
-        self._registered_services = registered_services
-        self._custom_instantiation_methods = custom_instantiation_methods
-        self._service_constructor = ServiceConstructor(self)
-        self._root_scope = ScopedServiceProvider(self._service_constructor, self)
+                 custom_instantiation_methods: Mapping[tuple[ServiceIdentifier, type], InstantiationMethodType],
+                 async_factories: Mapping[tuple[ServiceIdentifier, type], AsyncInstantiationMethodType],
+                 validate: bool = False):
+        scope_factory = ServiceIdentifier.from_type(IServiceScopeFactory)
+        service_provider = ServiceIdentifier.from_type(IServiceProvider)
+        self._registered_services = {
+            **registered_services,
+            scope_factory: [*registered_services.get(scope_factory, ()),
+                            RegisteredService(LifeScope.Singleton, IServiceScopeFactory, DependencyContainer)],
+            service_provider: [*registered_services.get(service_provider, ()),
+                               RegisteredService(LifeScope.Scoped, IServiceProvider, ScopedServiceProvider)],
+        }
+        self._custom_instantiation_methods = {
+            **custom_instantiation_methods,
+            (scope_factory, DependencyContainer): lambda _: self,
+            (service_provider, ScopedServiceProvider): lambda sp: sp,
+            **{key: _raise_not_initialized(key[0].Type) for key in async_factories},
+        }
+        self._async_factories = async_factories
+        self._compiled_services = compile_services(self._registered_services, self._custom_instantiation_methods)
+
+        if validate:
+            validate_services(self._compiled_services)
+
+        self._validated = validate
+        self._root_scope = ScopedServiceProvider(self._compiled_services, validated=validate)
+
+    @property
+    def service_provider(self) -> IServiceProvider:
+        return self._root_scope
 
     @contextlib.contextmanager
     def create_scope(self) -> Generator[IServiceScope, None, None]:
-        with ScopedServiceProvider(self._service_constructor, self, self._root_scope) as scope:
+        with self._new_scope() as scope:
             yield scope
 
+    @contextlib.asynccontextmanager
+    async def create_async_scope(self) -> AsyncGenerator[IServiceScope, None]:
+        async with self._new_scope() as scope:
+            yield scope
+
+    async def initialize(self):
+        await self._root_scope.initialize(self._async_factories)
+
     def dispose(self):
         self._root_scope.dispose()
 
+    async def aclose(self, timeout: float | None = None):
+        await self._root_scope.aclose(timeout)
+
+    async def __aenter__(self):
+        await self.initialize()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    def _new_scope(self) -> ScopedServiceProvider:
+        with start_span('create scope'):
+            return ScopedServiceProvider(self._compiled_services, self._root_scope, self._validated)
+
     def is_service_registered[T](self, t: type[T]) -> bool:
         identifier = ServiceIdentifier.from_type(t)
         return identifier in self._registered_services
@@ -51,3 +101,10 @@ class DependencyContainer:
     def get_instantiation_method[T](self, t: type[T], implementation_type: type) -> InstantiationMethodType | None:
         identifier = ServiceIdentifier.from_type(t)
         return self._custom_instantiation_methods.get((identifier, implementation_type), None)
+
+
+def _raise_not_initialized(t: type) -> InstantiationMethodType:
+    def instantiation_method(_: IServiceProvider) -> NoReturn:
+        raise AsyncServiceNotInitializedError(t)
+
+    return instantiation_method
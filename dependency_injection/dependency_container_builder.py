@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Awaitable
 
 from .dependency_container import DependencyContainer
-from .interfaces import IServiceScopeFactory, InstantiationMethodType, IServiceProvider, IDependencyContainer
+from .interfaces import InstantiationMethodType, IServiceProvider, IDependencyContainer, \
+    AsyncInstantiationMethodType
 from .models import RegisteredService, LifeScope, ServiceIdentifier
 
 
@@ -11,17 +12,28 @@ class DependencyContainerBuilder:
     def __init__(self):
         self._registered_services: dict[ServiceIdentifier, list[RegisteredService]] = {}
         self._custom_instantiation_methods: dict[tuple[ServiceIdentifier, type], InstantiationMethodType] = {}
+        self._async_factories: dict[tuple[ServiceIdentifier, type], AsyncInstantiationMethodType] = {}
 
-    def build(self) -> IDependencyContainer:
-        instance = DependencyContainer(self._registered_services, self._custom_instantiation_methods)
-        self.add_singleton(IServiceScopeFactory, DependencyContainer, lambda _: instance)
-        return instance
+    def build(self, validate: bool = False) -> IDependencyContainer:
+        return DependencyContainer(self._registered_services, self._custom_instantiation_methods,
+                                   self._async_factories, validate)
+
+    def validate(self) -> DependencyContainerBuilder:
+        DependencyContainer(self._registered_services, self._custom_instantiation_methods, self._async_factories,
+                            validate=True)
+        return self
 
     def add_singleton[TService, TImplementation: TService](self, service_type: type[TService],
                                                            implementation_type: type[TImplementation] | None = None,
                                                            instantiation_method: Callable[[
-                                                               IServiceProvider], TImplementation] = None) -> DependencyContainerBuilder:
+                                                               IServiceProvider], TImplementation] = None,
+                                                           async_factory: Callable[[IServiceProvider], Awaitable[
+                                                               TImplementation]] = None) -> DependencyContainerBuilder:
         self._add_service(service_type, implementation_type or service_type, LifeScope.Singleton, instantiation_method)
+
+        if async_factory is not None:
+            service_identifier = ServiceIdentifier.from_type(service_type)
+            self._async_factories[(service_identifier, implementation_type or service_type)] = async_factory
         return self
 
     def add_scoped[TService, TImplementation: TService](self, service_type: type[TService],
@@ -36,11 +48,32 @@ class DependencyContainerBuilder:
         self._add_service(service_type, implementation_type or service_type, LifeScope.Transient, instantiation_method)
         return self
 
+    def add_keyed_singleton[TService, TImplementation: TService](self, service_type: type[TService], key: object,
+                                                                 implementation_type: type[TImplementation] | None = None,
+                                                                 instantiation_method: InstantiationMethodType = None) -> DependencyContainerBuilder:
+        self._add_service(service_type, implementation_type or service_type, LifeScope.Singleton, instantiation_method,
+                          key)
+        return self
+
+    def add_keyed_scoped[TService, TImplementation: TService](self, service_type: type[TService], key: object,
+                                                              implementation_type: type[TImplementation] | None = None,
+                                                              instantiation_method: InstantiationMethodType = None) -> DependencyContainerBuilder:
+        self._add_service(service_type, implementation_type or service_type, LifeScope.Scoped, instantiation_method, key)
+        return self
+
+    def add_keyed_transient[TService, TImplementation: TService](self, service_type: type[TService], key: object,
+                                                                 implementation_type: type[TImplementation] | None = None,
+                                                                 instantiation_method: InstantiationMethodType = None) -> DependencyContainerBuilder:
+        self._add_service(service_type, implementation_type or service_type, LifeScope.Transient, instantiation_method,
+                          key)
+        return self
+
     def _add_service[TService, TImplementation:TService](self, service_type: type[TService],
                                                          implementation_type: type[TImplementation],
                                                          life_scope: LifeScope,
-                                                         instantiation_method: InstantiationMethodType | None):
-        service_identifier = ServiceIdentifier.from_type(service_type)
+                                                         instantiation_method: InstantiationMethodType | None,
+                                                         key: object = None):
+        service_identifier = ServiceIdentifier.from_type(service_type, key)
         registered_services = self._registered_services.get(service_identifier, [])
         registered_services.append(RegisteredService(life_scope, service_type, implementation_type))
         self._registered_services[service_identifier] = registered_services
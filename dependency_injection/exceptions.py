@@ -14,6 +14,13 @@ class UnregisteredTypeError(DependencyInjectionException):
         self.type = t
 
 
+class UnregisteredKeyedServiceError(DependencyInjectionException):
+    def __init__(self, t: type, key: object):
+        super().__init__(f"Type '{t.__name__}' was not registered with key {key!r}")
+        self.type = t
+        self.key = key
+
+
 class IncompatibleScopesError(DependencyInjectionException):
     def __init__(self, dependency_service: RegisteredService, dependent_service: RegisteredService):
         super().__init__(f"Can't inject service '{dependency_service.service_type.__name__}' with scope "
@@ -31,6 +38,13 @@ class UnannotatedParameterError(DependencyInjectionException):
         self.type = t
 
 
+class AsyncServiceNotInitializedError(DependencyInjectionException):
+    def __init__(self, t: type):
+        super().__init__(f"Service '{t.__name__}' has an async factory and must be created by initializing the "
+                         f"container before it is resolved")
+        self.type = t
+
+
 class CircularDependencyError(DependencyInjectionException):
     def __init__(self, visited: Iterable[type], t: type):
         super().__init__(f"Circular dependency detected: {' → '.join(v.__name__ for v in visited)} → {t.__name__}")
@@ -1,9 +1,11 @@
 import contextlib
-from typing import Protocol, Callable, Generator, Self, Sequence
+from typing import Protocol, Callable, Generator, Self, Sequence, Awaitable, AsyncGenerator
 
+from .compiled_service import CompiledService
 from .models import RegisteredService
 
 type InstantiationMethodType = Callable[[IServiceProvider], object]
+type AsyncInstantiationMethodType = Callable[[IServiceProvider], Awaitable[object]]
 
 
 class IServiceRegistrationHandler(Protocol):
@@ -33,6 +35,12 @@ class IServiceProvider(Protocol):
     def get_services[T](self, t: type[T]) -> Sequence[T]:
         ...
 
+    def get_keyed_service[T](self, t: type[T], key: object) -> T | None:
+        ...
+
+    def get_required_keyed_service[T](self, t: type[T], key: object) -> T:
+        ...
+
 
 class IServiceScope(Protocol):
     @property
@@ -45,18 +53,44 @@ class IServiceScope(Protocol):
     def __exit__(self, exc_type, exc_val, exc_tb):
         ...
 
+    async def __aenter__(self) -> Self:
+        ...
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        ...
+
 
 class IServiceScopeFactory(Protocol):
     @contextlib.contextmanager
     def create_scope(self) -> Generator[IServiceScope, None, None]:
         ...
 
+    @contextlib.asynccontextmanager
+    async def create_async_scope(self) -> AsyncGenerator[IServiceScope, None]:
+        ...
 
-class IServiceConstructor(Protocol):
-    def construct_type[T](self, service_provider: IServiceProvider, service: RegisteredService) -> T:
+
+class ICompiledServiceResolver(Protocol):
+    def resolve_compiled(self, service: CompiledService) -> object:
         ...
 
 
 class IDependencyContainer(IServiceScopeFactory, IServiceRegistrationHandler, Protocol):
+    @property
+    def service_provider(self) -> IServiceProvider:
+        ...
+
     def dispose(self) -> None:
         ...
+
+    async def initialize(self) -> None:
+        ...
+
+    async def aclose(self, timeout: float | None = None) -> None:
+        ...
+
+    async def __aenter__(self) -> Self:
+        ...
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        ...
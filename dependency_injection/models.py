@@ -19,5 +19,5 @@ class ServiceIdentifier(NamedTuple):
     Key: object = None
 
     @classmethod
-    def from_type[T](cls, t: type[T]) -> Self:
-        return cls(t)
+    def from_type[T](cls, t: type[T], key: object = None) -> Self:
+        return cls(t, key)
@@ -1,21 +1,23 @@
-import functools
-from typing import Sequence
-
-from .exceptions import UnregisteredTypeError, CircularDependencyError, IncompatibleScopesError
-from .interfaces import IServiceConstructor, IServiceRegistrationHandler, IServiceProvider, InstantiationMethodType
-from .models import LifeScope, ServiceIdentifier, RegisteredService
+from typing import Sequence, Mapping
+
+from .compiled_service import CompiledService
+from .exceptions import UnregisteredTypeError, CircularDependencyError, IncompatibleScopesError, \
+    UnregisteredKeyedServiceError
+from .interfaces import IServiceProvider, AsyncInstantiationMethodType
+from .models import LifeScope, ServiceIdentifier
+from .service_compiler import CompiledServices
 from .service_scope import ServiceScope
 
 
 class ScopedServiceProvider:
-    def __init__(self, service_constructor: IServiceConstructor,
-                 service_reg_handler: IServiceRegistrationHandler,
-                 root_service_provider: IServiceProvider | None = None):
+    def __init__(self, compiled_services: CompiledServices,
+                 root_service_provider: 'ScopedServiceProvider | None' = None, validated: bool = False):
         self._root_service_provider = root_service_provider
-        self._service_constructor = service_constructor
-        self._service_reg_handler = service_reg_handler
+        self._compiled_services = compiled_services
         self._scope = ServiceScope()
-        self._visited: list[RegisteredService] = []
+        self._singleton_scope = self._scope if root_service_provider is None else root_service_provider._scope
+        self._visited: dict[CompiledService, None] = {}
+        self._construct = self._create if validated else self._create_checked
         self._disposed = False
 
     @property
@@ -28,19 +30,37 @@ class ScopedServiceProvider:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.dispose()
 
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def initialize(self, async_factories: Mapping[tuple[ServiceIdentifier, type], AsyncInstantiationMethodType]):
+        for key, async_factory in async_factories.items():
+            if not self._scope.has_instance(key):
+                self._scope.add_instance(key, await async_factory(self))
+
     def dispose(self):
         if self._disposed:
             return
 
+        self._disposed = True
         self._scope.dispose_instances()
+
+    async def aclose(self, timeout: float | None = None):
+        if self._disposed:
+            return
+
         self._disposed = True
+        await self._scope.aclose_instances(timeout)
 
     def get_service[T](self, t: type[T]) -> T | None:
-        service = self._service_reg_handler.get_registered_service_data(t)
-        if service is None:
+        services = self._compiled_services.get(t, None)
+        if not services:
             return None
 
-        return self._resolve_service(t, service)
+        return self.resolve_compiled(services[-1])
 
     def get_required_service[T](self, t: type[T]) -> T:
         service = self.get_service(t)
@@ -51,45 +71,51 @@ class ScopedServiceProvider:
         return service
 
     def get_services[T](self, t: type[T]) -> Sequence[T]:
-        registered_services = self._service_reg_handler.get_registered_services_data(t)
-        services: list[T] = []
+        return [self.resolve_compiled(service) for service in self._compiled_services.get(t, ())]
+
+    def get_keyed_service[T](self, t: type[T], key: object) -> T | None:
+        services = self._compiled_services.get(ServiceIdentifier(t, key), None)
+        if not services:
+            return None
 
-        for registered_service in registered_services:
-            services.append(self._resolve_service(t, registered_service))
+        return self.resolve_compiled(services[-1])
 
-        return services
+    def get_required_keyed_service[T](self, t: type[T], key: object) -> T:
+        service = self.get_keyed_service(t, key)
 
-    def _resolve_service[T](self, t: type[T], service: RegisteredService) -> T:
-        self._check_dependency_constraints(service, t)
+        if service is None:
+            raise UnregisteredKeyedServiceError(t, key)
 
-        self._visited.append(service)
-        instantiation_method = self._get_instantiation_method(service, t)
-        try:
-            return self._instantiate_service(instantiation_method, service, t)
-        finally:
-            self._visited.remove(service)
+        return service
 
-    def _check_dependency_constraints[T](self, service: RegisteredService, t: type[T]):
-        if service in self._visited:
-            raise CircularDependencyError(map(lambda s: s.implementation_type, self._visited), t)
+    def resolve_compiled(self, service: CompiledService) -> object:
+        life_scope = service.life_scope
+        if life_scope is LifeScope.Transient:
+            return self._construct(service)
 
-        last_visited_service = self._visited[-1] if self._visited else None
-        if last_visited_service is not None and service.life_scope < last_visited_service.life_scope:
-            raise IncompatibleScopesError(service, last_visited_service)
+        scope = self._scope if life_scope is LifeScope.Scoped else self._singleton_scope
+        return scope.get_instance(service.key, self._construct, service)
+
+    def _create(self, service: CompiledService) -> object:
+        if service.dynamic_dependencies or self._visited:
+            return self._create_checked(service)
 
-    def _get_instantiation_method[T](self, service: RegisteredService, t: type[T]) -> InstantiationMethodType:
-        instantiation_method = self._service_reg_handler.get_instantiation_method(t, service.implementation_type)
+        return service.create(self)
 
-        if instantiation_method is None:
-            instantiation_method = functools.partial(self._service_constructor.construct_type, service=service)
-        return instantiation_method
+    def _create_checked(self, service: CompiledService) -> object:
+        self._check_dependency_constraints(service)
 
-    def _instantiate_service[T](self, instantiation_method: InstantiationMethodType, service: RegisteredService,
-                                t: type[T]) -> object:
-        if service.life_scope is LifeScope.Transient:
-            return instantiation_method(self.service_provider)
+        self._visited[service] = None
+        try:
+            return service.create(self)
+        finally:
+            del self._visited[service]
 
-        sp = self._root_service_provider if service.life_scope is LifeScope.Singleton else self
+    def _check_dependency_constraints(self, service: CompiledService):
+        if service in self._visited:
+            raise CircularDependencyError(map(lambda s: s.service.implementation_type, self._visited),
+                                          service.service.service_type)
 
-        return sp._scope.get_instance(ServiceIdentifier.from_type(t), service.implementation_type,
-                                      lambda: instantiation_method(self.service_provider))
+        last_visited_service = next(reversed(self._visited), None)
+        if last_visited_service is not None and service.life_scope < last_visited_service.life_scope:
+            raise IncompatibleScopesError(service.service, last_visited_service.service)
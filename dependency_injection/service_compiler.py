@@ -0,0 +1,74 @@
+import inspect
+from typing import Callable, Mapping, Sequence, NoReturn
+
+from .compiled_service import CompiledService
+from .exceptions import UnannotatedParameterError, IncompatibleScopesError, UnregisteredTypeError
+from .interfaces import InstantiationMethodType, ICompiledServiceResolver
+from .models import RegisteredService, ServiceIdentifier
+
+type CompiledServices = Mapping[type | ServiceIdentifier, Sequence[CompiledService]]
+
+
+def compile_services(registered_services: Mapping[ServiceIdentifier, Sequence[RegisteredService]],
+                     custom_instantiation_methods: Mapping[tuple[ServiceIdentifier, type], InstantiationMethodType]
+                     ) -> CompiledServices:
+    compiled_services: dict[type | ServiceIdentifier, tuple[CompiledService, ...]] = {
+        identifier.Type if identifier.Key is None else identifier: tuple(CompiledService(identifier, service)
+                                                                         for service in services)
+        for identifier, services in registered_services.items()
+    }
+
+    for services in compiled_services.values():
+        for compiled in services:
+            instantiation_method = custom_instantiation_methods.get(compiled.key, None)
+            if instantiation_method is not None:
+                compiled.create = instantiation_method
+                compiled.dynamic_dependencies = True
+            else:
+                _compile_constructor(compiled, compiled_services)
+
+    return compiled_services
+
+
+def _compile_constructor(compiled: CompiledService, compiled_services: CompiledServices):
+    implementation_type = compiled.service.implementation_type
+    try:
+        parameters = tuple(_get_constructor_dependencies(compiled.service, compiled_services))
+    except Exception as e:
+        compiled.error = e
+        compiled.create = _raise_on_create(e)
+        return
+
+    def create(resolver: ICompiledServiceResolver) -> object:
+        resolve = resolver.resolve_compiled
+        return implementation_type(**{name: resolve(dependency) for name, dependency in parameters})
+
+    compiled.dependencies = tuple(dependency for _, dependency in parameters)
+    compiled.create = create
+
+
+def _get_constructor_dependencies(service: RegisteredService, compiled_services: CompiledServices):
+    for name, param in inspect.signature(service.implementation_type).parameters.items():
+        if name == "self":
+            continue
+
+        ann = param.annotation
+        if ann is inspect.Parameter.empty:
+            raise UnannotatedParameterError(name, service.implementation_type)
+
+        dependencies = compiled_services.get(ann, ())
+        if not dependencies:
+            raise UnregisteredTypeError(ann)
+
+        dependency = dependencies[-1]
+        if dependency.life_scope < service.life_scope:
+            raise IncompatibleScopesError(dependency.service, service)
+
+        yield name, dependency
+
+
+def _raise_on_create(error: Exception) -> Callable[[object], NoReturn]:
+    def create(_) -> NoReturn:
+        raise error
+
+    return create
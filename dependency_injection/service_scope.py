@@ -1,19 +1,28 @@
+import asyncio
 from typing import Callable
 
 from .models import ServiceIdentifier
 
+_missing = object()
+
 
 class ServiceScope:
     def __init__(self) -> None:
         self._instances: dict[tuple[ServiceIdentifier, type], object] = {}
 
-    def get_instance[T](self, identifier: ServiceIdentifier, implementation: type,
-                        instantiation_method: Callable[[], T]) -> T:
-        key = (identifier, implementation)
-        if key not in self._instances:
-            self._instances[key] = instantiation_method()
+    def get_instance[TArg, T](self, key: tuple[ServiceIdentifier, type], instantiation_method: Callable[[TArg], T],
+                              argument: TArg) -> T:
+        instance = self._instances.get(key, _missing)
+        if instance is _missing:
+            instance = self._instances[key] = instantiation_method(argument)
+
+        return instance
+
+    def has_instance(self, key: tuple[ServiceIdentifier, type]) -> bool:
+        return key in self._instances
 
-        return self._instances[key]
+    def add_instance(self, key: tuple[ServiceIdentifier, type], instance: object):
+        self._instances[key] = instance
 
     def dispose_instances(self):
         for instance in self._instances.values():
@@ -21,3 +30,31 @@ class ServiceScope:
             if dispose_method:
                 dispose_method()
         self._instances.clear()
+
+    async def aclose_instances(self, timeout: float | None = None):
+        instances = {id(instance): instance for instance in self._instances.values()}.values()
+        self._instances.clear()
+
+        tasks = {asyncio.ensure_future(_aclose_instance(instance)): instance for instance in instances
+                 if hasattr(instance, 'aclose') or hasattr(instance, 'dispose')}
+        if not tasks:
+            return
+
+        done, pending = await asyncio.wait(tasks, timeout=timeout)
+
+        for task in done:
+            if task.exception() is not None:
+                print(f"Failed to dispose '{type(tasks[task]).__name__}': {task.exception()!r}")
+
+        for task in pending:
+            task.cancel()
+            print(f"Disposing '{type(tasks[task]).__name__}' did not finish within {timeout} seconds")
+
+
+async def _aclose_instance(instance: object):
+    aclose_method = getattr(instance, 'aclose', None)
+    if aclose_method:
+        await aclose_method()
+        return
+
+    instance.dispose()
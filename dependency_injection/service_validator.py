@@ -0,0 +1,22 @@
+import graphlib
+
+from .exceptions import CircularDependencyError
+from .service_compiler import CompiledServices
+
+
+def validate_services(compiled_services: CompiledServices):
+    sorter = graphlib.TopologicalSorter()
+
+    for services in compiled_services.values():
+        for compiled in services:
+            if compiled.error is not None:
+                raise compiled.error
+
+            sorter.add(compiled, *compiled.dependencies)
+
+    try:
+        sorter.prepare()
+    except graphlib.CycleError as e:
+        cycle = list(reversed(e.args[1]))
+        raise CircularDependencyError((s.service.implementation_type for s in cycle[:-1]),
+                                      cycle[-1].service.implementation_type) from None
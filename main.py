@@ -1,63 +1,269 @@
-import asyncio
 from collections import Counter
 from collections.abc import Sequence
 
-from fastapi.responses import JSONResponse
+from fastapi import Request
+from fastapi.responses import JSONResponse, Response
 
-from dependency_injection import DependencyContainerBuilder
+from configuration import IOptionsMonitor
+from dependency_injection import DependencyContainerBuilder, IServiceProvider
+from metrics import MetricsRegistry, CONTENT_TYPE
 from models import Notification, TrueNasAlert
+from notification_ingest import BatchConfig, ItemHandler, process_batch, read_batch, is_ndjson_content_type
+from notification_delivery import DeliveryConfig, DeliveryQueue, DeliveryWorkers, NotificationDispatcher, \
+    INotificationOutbox, NullOutbox, SqliteOutbox, RetryConfig, RetryScheduler, \
+    RateLimitConfig, RateLimiter, CoalescingConfig, NotificationCoalescer, DeduplicationConfig, \
+    NotificationDeduplicator, CircuitBreakerConfig, CircuitBreakers, DeadlineConfig
 from notification_publishers import find_notification_publishers, NotificationPublisher, ProcessingResult, \
-    TelegramConfig, GotifyConfig
-from web_application import WebApplicationBuilder, WebApplication
+    TelegramConfig, GotifyConfig, TelegramBotClient, GotifyHttpClient, get_publisher_name
+from notification_routing import NotificationRouter, RoutingConfig
+from tracing import TracingConfig, Tracer, RingBufferExporter, OtlpFileExporter, ISpanExporter, set_tracer
+from web_application import WebApplicationBuilder, WebApplication, IHostedService
 
 
-async def process_notification(notification: Notification, notification_publishers: tuple[NotificationPublisher]):
-    results: Sequence[ProcessingResult] = await asyncio.gather(
-        *(p.process(notification) for p in notification_publishers)
-    )
+async def process_notification(notification: Notification, service_provider: IServiceProvider,
+                               router: NotificationRouter, dispatcher: NotificationDispatcher,
+                               deduplicator: NotificationDeduplicator):
+    content, status_code = await _forward_notification(notification, service_provider, router, dispatcher,
+                                                       deduplicator, dispatcher.get_request_deadline())
+    return JSONResponse(content=content, status_code=status_code)
+
+
+async def enqueue_notification(notification: Notification, delivery_queue: DeliveryQueue,
+                               deduplicator: NotificationDeduplicator):
+    content, status_code = await _enqueue_notification(notification, delivery_queue, deduplicator)
+    return JSONResponse(content=content, status_code=status_code)
+
+
+async def process_true_nas_notification(data: TrueNasAlert, service_provider: IServiceProvider,
+                                        router: NotificationRouter, dispatcher: NotificationDispatcher,
+                                        deduplicator: NotificationDeduplicator):
+    return await process_notification(_true_nas_alert_to_notification(data), service_provider, router, dispatcher,
+                                      deduplicator)
+
+
+async def enqueue_true_nas_notification(data: TrueNasAlert, delivery_queue: DeliveryQueue,
+                                        deduplicator: NotificationDeduplicator):
+    return await enqueue_notification(_true_nas_alert_to_notification(data), delivery_queue, deduplicator)
+
+
+async def process_notification_batch(request: Request, service_provider: IServiceProvider,
+                                     router: NotificationRouter, dispatcher: NotificationDispatcher,
+                                     deduplicator: NotificationDeduplicator, batch_config: BatchConfig):
+    deadline = dispatcher.get_request_deadline()
+
+    async def handle(notification: Notification) -> dict[str, object]:
+        content, _ = await _forward_notification(notification, service_provider, router, dispatcher, deduplicator,
+                                                 deadline)
+        return content
+
+    return await _process_batch(request, handle, batch_config, 200)
+
+
+async def enqueue_notification_batch(request: Request, delivery_queue: DeliveryQueue,
+                                     deduplicator: NotificationDeduplicator, batch_config: BatchConfig):
+    async def handle(notification: Notification) -> dict[str, object]:
+        content, _ = await _enqueue_notification(notification, delivery_queue, deduplicator)
+        return content
+
+    return await _process_batch(request, handle, batch_config, 202)
+
+
+async def _forward_notification(notification: Notification, service_provider: IServiceProvider,
+                                router: NotificationRouter, dispatcher: NotificationDispatcher,
+                                deduplicator: NotificationDeduplicator,
+                                deadline: float | None = None) -> tuple[dict[str, object], int]:
+    if deduplicator.is_duplicate(notification):
+        return _suppressed_content(notification, deduplicator), 200
+
+    notification_publishers = router.get_publishers(notification, service_provider)
+    results: Sequence[ProcessingResult] = await dispatcher.dispatch(notification, notification_publishers,
+                                                                    deadline=deadline)
     counter = Counter(results)
 
+    return {"status": f"forwarded '{notification.title}'",
+            "processors": [p.__class__.__name__ for p in notification_publishers],
+            "counter": tuple(map(lambda e: e.name, counter.elements())),
+            "fail": counter.get(ProcessingResult.Fail, 0),
+            "skip": counter.get(ProcessingResult.Skip, 0),
+            "success": counter.get(ProcessingResult.Success, 0),
+            "circuit_open": counter.get(ProcessingResult.CircuitOpen, 0),
+            "timeout": counter.get(ProcessingResult.Timeout, 0),
+            "rate_limited": counter.get(ProcessingResult.RateLimited, 0)}, 200
+
+
+async def _enqueue_notification(notification: Notification, delivery_queue: DeliveryQueue,
+                                deduplicator: NotificationDeduplicator) -> tuple[dict[str, object], int]:
+    if deduplicator.is_duplicate(notification):
+        return _suppressed_content(notification, deduplicator), 200
+
+    delivery_id = await delivery_queue.enqueue(notification)
+
+    if delivery_id is None:
+        return {"status": f"rejected '{notification.title}', the delivery queue is full"}, 503
+
+    return {"status": f"accepted '{notification.title}'",
+            "delivery_id": delivery_id}, 202
+
+
+async def _process_batch(request: Request, handler: ItemHandler, batch_config: BatchConfig,
+                         status_code: int) -> JSONResponse:
+    ndjson = is_ndjson_content_type(request.headers.get('content-type', ''))
+    batch = await process_batch(read_batch(request.stream(), ndjson), handler, batch_config)
+
+    content: dict[str, object] = {"status": f"processed {len(batch.results)} notification(s)",
+                                  "results": batch.results}
+    if batch.error is not None:
+        content["error"] = batch.error
+        status_code = 207 if batch.results else 400
+
+    return JSONResponse(content=content, status_code=status_code)
+
+
+async def get_circuit_breakers(circuit_breakers: CircuitBreakers):
     return JSONResponse(
-        content={"status": f"forwarded '{notification.title}'",
-                 "processors": [p.__class__.__name__ for p in notification_publishers],
-                 "counter": tuple(map(lambda e: e.name, counter.elements())),
-                 "fail": counter.get(ProcessingResult.Fail, 0),
-                 "skip": counter.get(ProcessingResult.Skip, 0),
-                 "success": counter.get(ProcessingResult.Success, 0)},
+        content={name: status._asdict() for name, status in circuit_breakers.get_statuses().items()},
         status_code=200,
     )
 
 
-async def process_true_nas_notification(data: TrueNasAlert, notification_publishers: tuple[NotificationPublisher]):
+async def get_metrics(metrics: MetricsRegistry):
+    return Response(content=metrics.render(), media_type=CONTENT_TYPE)
+
+
+async def get_traces(ring_buffer: RingBufferExporter):
+    return JSONResponse(content=ring_buffer.get_traces(), status_code=200)
+
+
+def _suppressed_content(notification: Notification, deduplicator: NotificationDeduplicator) -> dict[str, object]:
+    return {"status": f"suppressed duplicate '{notification.title}'",
+            "suppressed": deduplicator.suppressed_count}
+
+
+def _true_nas_alert_to_notification(data: TrueNasAlert) -> Notification:
     print(f'Got {data} from TrueNAS')
-    notification = Notification(source='truenas', title='Message from TrueNAS', severity='unknown', message=data.text)
-    await process_notification(notification, notification_publishers)
+    return Notification(source='truenas', title='Message from TrueNAS', severity='unknown', message=data.text)
+
+
+async def create_telegram_bot_client(service_provider: IServiceProvider) -> TelegramBotClient:
+    bot_client = TelegramBotClient(service_provider.get_required_service(IOptionsMonitor[TelegramConfig]))
+    try:
+        await bot_client.initialize()
+    except Exception as e:
+        print(f"Could not initialize the Telegram bot, retrying on first use: {e}")
+    return bot_client
 
 
 def add_notification_processors_to_di(di: DependencyContainerBuilder):
+    di.add_singleton(TelegramBotClient, async_factory=create_telegram_bot_client)
+    di.add_singleton(GotifyHttpClient)
+
     processors = find_notification_publishers()
     for t in processors:
-        di.add_scoped(NotificationPublisher, t)
+        name = get_publisher_name(t)
+        di.add_keyed_scoped(NotificationPublisher, name, t)
+        di.add_scoped(NotificationPublisher, t, lambda service_provider, key=name:
+                      service_provider.get_required_keyed_service(NotificationPublisher, key))
+
+    di.add_singleton(NotificationRouter)
+
+
+def add_notification_delivery_to_di(di: DependencyContainerBuilder, delivery_config: DeliveryConfig):
+    di.add_singleton(RetryScheduler)
+    di.add_singleton(RateLimiter)
+    di.add_singleton(CircuitBreakers)
+    di.add_singleton(NotificationDeduplicator)
+    di.add_singleton(NotificationDispatcher)
+
+    if delivery_config.asynchronous:
+        di.add_singleton(INotificationOutbox, SqliteOutbox if delivery_config.outbox_path else NullOutbox)
+        di.add_singleton(DeliveryQueue)
+        di.add_singleton(NotificationCoalescer)
+        di.add_singleton(IHostedService, DeliveryWorkers)
+
+
+def add_tracing_to_di(di: DependencyContainerBuilder, tracing_config: TracingConfig):
+    ring_buffer = RingBufferExporter(tracing_config.ring_buffer_size)
+    exporters: list[ISpanExporter] = [ring_buffer]
+    if tracing_config.otlp_file_path:
+        exporters.append(OtlpFileExporter(tracing_config.otlp_file_path, tracing_config.service_name))
+
+    tracer = Tracer(tracing_config.sample_rate, exporters)
+    set_tracer(tracer)
+    di.add_singleton(Tracer, instantiation_method=lambda _: tracer)
+    di.add_singleton(IHostedService, Tracer, instantiation_method=lambda _: tracer)
+    di.add_singleton(RingBufferExporter, instantiation_method=lambda _: ring_buffer)
 
 
 from configuration import data_providers
 
-if __name__ == "__main__":
+
+def build_app() -> WebApplication:
     wab: WebApplicationBuilder = WebApplicationBuilder()
-    add_notification_processors_to_di(wab.services)
 
     wab.configuration \
-        .add_provider(data_providers.dot_env_file())
+        .add_provider(data_providers.dot_env_file()) \
+        .add_provider(data_providers.environment_variables('NOTIFICATIONS__'))
     section = wab.configuration.get_section('Gotify')
     wab.configuration.configure(section, GotifyConfig)
     section = wab.configuration.get_section('Telegram')
     wab.configuration.configure(section, TelegramConfig)
+    section = wab.configuration.get_section('Delivery')
+    wab.configuration.configure(section, DeliveryConfig, DeliveryConfig())
+    delivery_config = section.get(DeliveryConfig) or DeliveryConfig()
+    section = wab.configuration.get_section('Retry')
+    wab.configuration.configure(section, RetryConfig, RetryConfig())
+    section = wab.configuration.get_section('RateLimit')
+    wab.configuration.configure(section, RateLimitConfig, RateLimitConfig())
+    section = wab.configuration.get_section('Coalescing')
+    wab.configuration.configure(section, CoalescingConfig, CoalescingConfig())
+    section = wab.configuration.get_section('Deduplication')
+    wab.configuration.configure(section, DeduplicationConfig, DeduplicationConfig())
+    section = wab.configuration.get_section('Batch')
+    wab.configuration.configure(section, BatchConfig, BatchConfig())
+    section = wab.configuration.get_section('CircuitBreaker')
+    wab.configuration.configure(section, CircuitBreakerConfig, CircuitBreakerConfig())
+    section = wab.configuration.get_section('Deadlines')
+    wab.configuration.configure(section, DeadlineConfig, DeadlineConfig())
+    section = wab.configuration.get_section('Routing')
+    wab.configuration.configure(section, RoutingConfig, RoutingConfig())
+    tracing_config = wab.configuration.get_section('Tracing').get(TracingConfig) or TracingConfig()
 
-    app: WebApplication = wab.build()
-    app.map_post('/notify', process_notification) \
-        .with_dependencies() \
+    add_tracing_to_di(wab.services, tracing_config)
+    add_notification_processors_to_di(wab.services)
+    add_notification_delivery_to_di(wab.services, delivery_config)
+
+    app: WebApplication = wab.build(validate=True)
+    if delivery_config.asynchronous:
+        app.map_post('/notify', enqueue_notification) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+        app.map_post('/truenas-notify', enqueue_true_nas_notification) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+        app.map_post('/notify/batch', enqueue_notification_batch) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+    else:
+        app.map_post('/notify', process_notification) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+        app.map_post('/truenas-notify', process_true_nas_notification) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+        app.map_post('/notify/batch', process_notification_batch) \
+            .with_dependencies(single_injector=True) \
+            .apply()
+    app.map_get('/circuit-breakers', get_circuit_breakers) \
+        .with_dependencies(single_injector=True) \
+        .apply()
+    app.map_get('/metrics', get_metrics) \
+        .with_dependencies(single_injector=True) \
         .apply()
-    app.map_post('/truenas-notify', process_true_nas_notification) \
-        .with_dependencies() \
+    app.map_get('/debug/traces', get_traces) \
+        .with_dependencies(single_injector=True) \
         .apply()
-    app.run()
+    return app
+
+
+if __name__ == "__main__":
+    build_app().run()
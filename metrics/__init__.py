@@ -0,0 +1,10 @@
+from .counter import Counter, CounterValue
+from .exceptions import MetricsException, MetricTypeMismatchError, LabelCountMismatchError
+from .gauge import Gauge, GaugeValue
+from .histogram import Histogram, HistogramValue, DEFAULT_BUCKETS
+from .interfaces import IMetric
+from .metrics_registry import MetricsRegistry, CONTENT_TYPE
+
+__all__ = ('MetricsRegistry', 'Counter', 'CounterValue', 'Gauge', 'GaugeValue', 'Histogram', 'HistogramValue',
+           'DEFAULT_BUCKETS', 'IMetric', 'CONTENT_TYPE', 'MetricsException', 'MetricTypeMismatchError',
+           'LabelCountMismatchError')
@@ -0,0 +1,25 @@
+from .metric_family import MetricFamily, format_sample
+
+
+class CounterValue:
+    __slots__ = ('labels', 'value')
+
+    def __init__(self, labels: str):
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+
+class Counter(MetricFamily[CounterValue]):
+    type_name = 'counter'
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def _create_child(self, labels: str) -> CounterValue:
+        return CounterValue(labels)
+
+    def _render_child(self, child: CounterValue, lines: list[str]) -> None:
+        lines.append(format_sample(f'{self._name}_total', child.labels, child.value))
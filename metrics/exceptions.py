@@ -0,0 +1,21 @@
+class MetricsException(Exception):
+    def __init__(self, error_message: str):
+        super().__init__(error_message)
+
+
+class MetricTypeMismatchError(MetricsException):
+    def __init__(self, name: str, registered_type: type, requested_type: type):
+        super().__init__(f"Metric '{name}' is registered as {registered_type.__name__}, "
+                         f"can't use it as {requested_type.__name__}")
+        self.name = name
+        self.registered_type = registered_type
+        self.requested_type = requested_type
+
+
+class LabelCountMismatchError(MetricsException):
+    def __init__(self, name: str, label_names: tuple[str, ...], label_values: tuple[str, ...]):
+        super().__init__(f"Metric '{name}' expects label(s) ({', '.join(label_names)}), "
+                         f"got {len(label_values)} value(s)")
+        self.name = name
+        self.label_names = label_names
+        self.label_values = label_values
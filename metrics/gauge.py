@@ -0,0 +1,49 @@
+from typing import Callable
+
+from .metric_family import MetricFamily, format_sample
+
+
+class GaugeValue:
+    __slots__ = ('labels', 'value', 'function')
+
+    def __init__(self, labels: str):
+        self.labels = labels
+        self.value = 0
+        self.function: Callable[[], float] | None = None
+
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+    def set(self, value: float):
+        self.value = value
+
+    def set_function(self, function: Callable[[], float] | None):
+        self.function = function
+
+    def get(self) -> float:
+        return self.value if self.function is None else self.function()
+
+
+class Gauge(MetricFamily[GaugeValue]):
+    type_name = 'gauge'
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1):
+        self.labels().dec(amount)
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float] | None):
+        self.labels().set_function(function)
+
+    def _create_child(self, labels: str) -> GaugeValue:
+        return GaugeValue(labels)
+
+    def _render_child(self, child: GaugeValue, lines: list[str]) -> None:
+        lines.append(format_sample(self._name, child.labels, child.get()))
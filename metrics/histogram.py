@@ -0,0 +1,48 @@
+import bisect
+from typing import Sequence
+
+from .metric_family import MetricFamily, format_sample, format_value
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class HistogramValue:
+    __slots__ = ('labels', 'buckets', 'bucket_counts', 'sum', 'count')
+
+    def __init__(self, labels: str, buckets: tuple[float, ...]):
+        self.labels = labels
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram(MetricFamily[HistogramValue]):
+    type_name = 'histogram'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self._buckets = tuple(sorted(buckets))
+        self._bucket_labels = (*(format_value(bucket) for bucket in self._buckets), '+Inf')
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _create_child(self, labels: str) -> HistogramValue:
+        return HistogramValue(labels, self._buckets)
+
+    def _render_child(self, child: HistogramValue, lines: list[str]) -> None:
+        separator = ',' if child.labels else ''
+        cumulative_count = 0
+        for bucket_label, bucket_count in zip(self._bucket_labels, tuple(child.bucket_counts)):
+            cumulative_count += bucket_count
+            lines.append(f'{self._name}_bucket{{{child.labels}{separator}le="{bucket_label}"}} {cumulative_count}')
+
+        lines.append(format_sample(f'{self._name}_sum', child.labels, child.sum))
+        lines.append(format_sample(f'{self._name}_count', child.labels, cumulative_count))
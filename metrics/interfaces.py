@@ -0,0 +1,10 @@
+from typing import Protocol
+
+
+class IMetric(Protocol):
+    @property
+    def name(self) -> str:
+        ...
+
+    def render(self, lines: list[str]) -> None:
+        ...
@@ -0,0 +1,73 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from .exceptions import LabelCountMismatchError
+
+
+def _escape_documentation(documentation: str) -> str:
+    return documentation.replace('\\', '\\\\').replace('\n', '\\n')
+
+
+def _escape_label_value(value: str) -> str:
+    return _escape_documentation(value).replace('"', '\\"')
+
+
+def format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    return ','.join(f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values))
+
+
+class MetricFamily[T](ABC):
+    type_name: str = 'untyped'
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self._name = name
+        self._documentation = documentation
+        self._label_names = tuple(label_names)
+        self._children: dict[tuple[str, ...], T] = {}
+        self._header = f'# HELP {name} {_escape_documentation(documentation)}\n# TYPE {name} {self.type_name}'
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def label_names(self) -> tuple[str, ...]:
+        return self._label_names
+
+    def labels(self, *label_values: str) -> T:
+        child = self._children.get(label_values, None)
+        if child is not None:
+            return child
+
+        if len(label_values) != len(self._label_names):
+            raise LabelCountMismatchError(self._name, self._label_names, label_values)
+
+        child = self._children[label_values] = self._create_child(format_labels(self._label_names, label_values))
+        return child
+
+    def render(self, lines: list[str]) -> None:
+        lines.append(self._header)
+        for child in tuple(self._children.values()):
+            self._render_child(child, lines)
+
+    @abstractmethod
+    def _create_child(self, labels: str) -> T:
+        pass
+
+    @abstractmethod
+    def _render_child(self, child: T, lines: list[str]) -> None:
+        pass
+
+
+def format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    if value == float('-inf'):
+        return '-Inf'
+    if isinstance(value, int) or value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+def format_sample(name: str, labels: str, value: float) -> str:
+    return f'{name}{{{labels}}} {format_value(value)}' if labels else f'{name} {format_value(value)}'
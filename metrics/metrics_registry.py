@@ -0,0 +1,44 @@
+from typing import Sequence, Callable
+
+from .counter import Counter
+from .exceptions import MetricTypeMismatchError
+from .gauge import Gauge
+from .histogram import Histogram, DEFAULT_BUCKETS
+from .interfaces import IMetric
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, IMetric] = {}
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._get_or_add(name, Counter, lambda: Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Gauge:
+        return self._get_or_add(name, Gauge, lambda: Gauge(name, documentation, label_names))
+
+    def histogram(self, name: str, documentation: str, label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self._get_or_add(name, Histogram, lambda: Histogram(name, documentation, label_names, buckets))
+
+    def register(self, metric: IMetric) -> None:
+        self._metrics[metric.name] = metric
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in tuple(self._metrics.values()):
+            metric.render(lines)
+
+        lines.append('')
+        return '\n'.join(lines)
+
+    def _get_or_add[T](self, name: str, t: type[T], create: Callable[[], T]) -> T:
+        metric = self._metrics.get(name, None)
+        if metric is None:
+            metric = self._metrics[name] = create()
+        elif type(metric) is not t:
+            raise MetricTypeMismatchError(name, type(metric), t)
+
+        return metric
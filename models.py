@@ -7,5 +7,8 @@ class Notification(BaseModel):
     severity: str
     message: str
 
+class NotificationDigest(Notification):
+    notifications: list[Notification]
+
 class TrueNasAlert(BaseModel):
     text: str
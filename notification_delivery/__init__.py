@@ -0,0 +1,22 @@
+from .configs import DeliveryConfig, RetryConfig, RetryPolicy, RateLimitConfig, RateLimitPolicy, \
+    CoalescingConfig, DeduplicationConfig, CircuitBreakerConfig, CircuitBreakerPolicy, \
+    DeadlineConfig
+from .circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitBreakerStatus, CircuitState
+from .delivery_queue import DeliveryQueue
+from .delivery_workers import DeliveryWorkers
+from .exceptions import NotificationDeliveryException, OutboxClosedError
+from .interfaces import INotificationOutbox
+from .models import QueuedNotification
+from .notification_coalescer import NotificationCoalescer
+from .notification_deduplicator import NotificationDeduplicator
+from .notification_dispatcher import NotificationDispatcher
+from .notification_outbox import NullOutbox, SqliteOutbox
+from .rate_limiter import RateLimiter
+from .retry_scheduler import RetryScheduler
+
+__all__ = ('DeliveryConfig', 'DeliveryQueue', 'QueuedNotification', 'DeliveryWorkers', 'NotificationDispatcher',
+           'INotificationOutbox', 'NullOutbox', 'SqliteOutbox', 'RetryConfig', 'RetryPolicy', 'RetryScheduler',
+           'RateLimitConfig', 'RateLimitPolicy', 'RateLimiter', 'CoalescingConfig', 'NotificationCoalescer',
+           'DeduplicationConfig', 'NotificationDeduplicator', 'CircuitBreakerConfig', 'CircuitBreakerPolicy',
+           'CircuitBreaker', 'CircuitBreakers', 'CircuitBreakerStatus', 'CircuitState',
+           'DeadlineConfig', 'NotificationDeliveryException', 'OutboxClosedError')
@@ -0,0 +1,149 @@
+import time
+from enum import StrEnum
+from typing import NamedTuple
+
+from configuration import IOptionsMonitor
+from .configs import CircuitBreakerConfig, CircuitBreakerPolicy
+
+_WINDOW_BUCKETS = 10
+
+
+class CircuitState(StrEnum):
+    Closed = 'closed'
+    Open = 'open'
+    HalfOpen = 'half-open'
+
+
+class CircuitBreakerStatus(NamedTuple):
+    state: CircuitState
+    failure_rate: float
+    calls: int
+    retry_in: float
+
+
+class CircuitBreaker:
+    def __init__(self, policy: CircuitBreakerPolicy):
+        self._policy = policy
+        self._bucket_duration = policy.window / _WINDOW_BUCKETS
+        self._bucket_epochs = [0] * _WINDOW_BUCKETS
+        self._bucket_calls = [0] * _WINDOW_BUCKETS
+        self._bucket_failures = [0] * _WINDOW_BUCKETS
+        self._state = CircuitState.Closed
+        self._open_until = 0.0
+        self._probe_in_flight = False
+
+    @property
+    def policy(self) -> CircuitBreakerPolicy:
+        return self._policy
+
+    @property
+    def state(self) -> CircuitState:
+        return self._state
+
+    @property
+    def retry_in(self) -> float:
+        match self._state:
+            case CircuitState.Open:
+                return max(0.0, self._open_until - time.monotonic())
+            case CircuitState.HalfOpen:
+                return self._policy.probe_interval
+            case _:
+                return 0.0
+
+    def allow_request(self) -> bool:
+        match self._state:
+            case CircuitState.Closed:
+                return True
+            case CircuitState.Open if time.monotonic() < self._open_until:
+                return False
+            case CircuitState.Open:
+                self._state = CircuitState.HalfOpen
+                self._probe_in_flight = True
+                return True
+            case _ if self._probe_in_flight:
+                return False
+            case _:
+                self._probe_in_flight = True
+                return True
+
+    def record_success(self):
+        if self._state is not CircuitState.Closed:
+            self._close()
+            return
+
+        self._record(failed=False)
+
+    def record_failure(self):
+        if self._state is not CircuitState.Closed:
+            self._open()
+            return
+
+        self._record(failed=True)
+        calls, failures = self._get_window_totals()
+        if calls >= self._policy.minimum_calls and failures / calls >= self._policy.failure_rate_threshold:
+            self._open()
+
+    def get_status(self) -> CircuitBreakerStatus:
+        calls, failures = self._get_window_totals()
+        return CircuitBreakerStatus(self._state, failures / calls if calls else 0.0, calls, self.retry_in)
+
+    def _open(self):
+        self._state = CircuitState.Open
+        self._open_until = time.monotonic() + self._policy.probe_interval
+        self._probe_in_flight = False
+
+    def _close(self):
+        self._state = CircuitState.Closed
+        self._probe_in_flight = False
+        for i in range(_WINDOW_BUCKETS):
+            self._bucket_calls[i] = self._bucket_failures[i] = 0
+
+    def _record(self, failed: bool):
+        epoch = int(time.monotonic() / self._bucket_duration)
+        index = epoch % _WINDOW_BUCKETS
+        if self._bucket_epochs[index] != epoch:
+            self._bucket_epochs[index] = epoch
+            self._bucket_calls[index] = self._bucket_failures[index] = 0
+
+        self._bucket_calls[index] += 1
+        if failed:
+            self._bucket_failures[index] += 1
+
+    def _get_window_totals(self) -> tuple[int, int]:
+        oldest_epoch = int(time.monotonic() / self._bucket_duration) - _WINDOW_BUCKETS
+        calls = failures = 0
+        for i in range(_WINDOW_BUCKETS):
+            if self._bucket_epochs[i] > oldest_epoch:
+                calls += self._bucket_calls[i]
+                failures += self._bucket_failures[i]
+
+        return calls, failures
+
+
+class CircuitBreakers:
+    def __init__(self, config_monitor: IOptionsMonitor[CircuitBreakerConfig]):
+        self._config = config_monitor.current_value
+        self._breakers: dict[str, CircuitBreaker] = {}
+        config_monitor.on_change(self._on_config_changed)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config.enabled
+
+    def get(self, publisher_name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(publisher_name, None)
+        if breaker is None:
+            breaker = self._breakers[publisher_name] = CircuitBreaker(self._get_policy(publisher_name))
+
+        return breaker
+
+    def get_statuses(self) -> dict[str, CircuitBreakerStatus]:
+        return {name: breaker.get_status() for name, breaker in self._breakers.items()}
+
+    def _get_policy(self, publisher_name: str) -> CircuitBreakerPolicy:
+        return self._config.publisher_policies.get(publisher_name, self._config.default_policy)
+
+    def _on_config_changed(self, config: CircuitBreakerConfig):
+        self._config = config
+        self._breakers = {name: breaker for name, breaker in self._breakers.items()
+                          if breaker.policy == self._get_policy(name)}
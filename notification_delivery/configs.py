@@ -0,0 +1,66 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class DeliveryConfig(NamedTuple):
+    asynchronous: bool = False
+    queue_size: int = 1000
+    workers: int = 4
+    shutdown_timeout: float = 10.0
+    outbox_path: str | None = None
+    outbox_flush_interval: float = 0.005
+    outbox_max_batch_size: int = 256
+
+
+class RetryPolicy(NamedTuple):
+    max_attempts: int = 5
+    base_delay: float = 1.0
+    max_delay: float = 300.0
+    jitter: float = 0.5
+
+
+class RetryConfig(NamedTuple):
+    default_policy: RetryPolicy = RetryPolicy()
+    publisher_policies: dict[str, RetryPolicy] = MappingProxyType({})
+
+
+class RateLimitPolicy(NamedTuple):
+    rate: float
+    burst: int = 1
+
+
+class RateLimitConfig(NamedTuple):
+    publisher_limits: dict[str, RateLimitPolicy] = MappingProxyType({'telegram': RateLimitPolicy(rate=30, burst=30)})
+    destination_limits: dict[str, RateLimitPolicy] = MappingProxyType({'telegram': RateLimitPolicy(rate=1, burst=3)})
+
+
+class CoalescingConfig(NamedTuple):
+    enabled: bool = False
+    window: float = 2.0
+    max_batch_size: int = 20
+    per_severity: bool = False
+
+
+class DeduplicationConfig(NamedTuple):
+    enabled: bool = False
+    ttl: float = 3600.0
+    max_entries: int = 10000
+
+
+class CircuitBreakerPolicy(NamedTuple):
+    failure_rate_threshold: float = 0.5
+    minimum_calls: int = 5
+    window: float = 30.0
+    probe_interval: float = 15.0
+
+
+class CircuitBreakerConfig(NamedTuple):
+    enabled: bool = True
+    default_policy: CircuitBreakerPolicy = CircuitBreakerPolicy()
+    publisher_policies: dict[str, CircuitBreakerPolicy] = MappingProxyType({})
+
+
+class DeadlineConfig(NamedTuple):
+    publisher_timeout: float = 10.0
+    publisher_timeouts: dict[str, float] = MappingProxyType({})
+    request_timeout: float = 15.0
@@ -0,0 +1,51 @@
+import asyncio
+import uuid
+
+from metrics import MetricsRegistry
+from models import Notification
+from .configs import DeliveryConfig
+from .interfaces import INotificationOutbox
+from .models import QueuedNotification
+
+
+class DeliveryQueue:
+    def __init__(self, config: DeliveryConfig, outbox: INotificationOutbox, metrics: MetricsRegistry):
+        self._queue: asyncio.Queue[QueuedNotification] = asyncio.Queue(maxsize=config.queue_size)
+        self._reserved = 0
+        self._outbox = outbox
+        metrics.gauge('delivery_queue_depth', 'Notifications waiting in the delivery queue') \
+            .set_function(self._queue.qsize)
+
+    @property
+    def size(self) -> int:
+        return self._queue.qsize()
+
+    async def enqueue(self, notification: Notification) -> str | None:
+        if self._queue.maxsize > 0 and self._queue.qsize() + self._reserved >= self._queue.maxsize:
+            return None
+
+        queued = QueuedNotification(uuid.uuid4().hex, notification)
+        self._reserved += 1
+        try:
+            await self._outbox.append(queued)
+        finally:
+            self._reserved -= 1
+
+        try:
+            self._queue.put_nowait(queued)
+        except asyncio.QueueFull:
+            await self._queue.put(queued)
+
+        return queued.delivery_id
+
+    async def requeue(self, queued: QueuedNotification):
+        await self._queue.put(queued)
+
+    async def get(self) -> QueuedNotification:
+        return await self._queue.get()
+
+    def task_done(self):
+        self._queue.task_done()
+
+    async def join(self):
+        await self._queue.join()
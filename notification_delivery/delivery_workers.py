@@ -0,0 +1,106 @@
+import asyncio
+import functools
+from typing import Sequence
+
+from dependency_injection import IServiceScopeFactory
+from notification_routing import NotificationRouter
+from tracing import start_trace
+from .configs import DeliveryConfig
+from .delivery_queue import DeliveryQueue
+from .interfaces import INotificationOutbox
+from .models import QueuedNotification
+from .notification_coalescer import NotificationCoalescer
+from .notification_dispatcher import NotificationDispatcher
+
+
+class DeliveryWorkers:
+    def __init__(self, config: DeliveryConfig, delivery_queue: DeliveryQueue, dispatcher: NotificationDispatcher,
+                 outbox: INotificationOutbox, coalescer: NotificationCoalescer, router: NotificationRouter,
+                 scope_factory: IServiceScopeFactory):
+        self._config = config
+        self._delivery_queue = delivery_queue
+        self._dispatcher = dispatcher
+        self._outbox = outbox
+        self._coalescer = coalescer
+        self._router = router
+        self._scope_factory = scope_factory
+        self._workers: list[asyncio.Task] = []
+        self._replay_task: asyncio.Task | None = None
+
+    async def start(self):
+        pending = await self._outbox.load_pending()
+        self._workers = [asyncio.create_task(self._run_worker()) for _ in range(self._config.workers)]
+        self._replay_task = asyncio.create_task(self._replay_pending(pending))
+
+    async def stop(self):
+        if self._replay_task is not None:
+            self._replay_task.cancel()
+            await asyncio.gather(self._replay_task, return_exceptions=True)
+            self._replay_task = None
+
+        await self._coalescer.flush_all()
+        try:
+            await asyncio.wait_for(self._delivery_queue.join(), self._config.shutdown_timeout)
+        except TimeoutError:
+            print(f'Stopping with {self._delivery_queue.size} undelivered notification(s) in the queue')
+
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    async def _replay_pending(self, pending: Sequence[QueuedNotification]):
+        if pending:
+            print(f'Replaying {len(pending)} undelivered notification(s) from the outbox')
+
+        for queued in pending:
+            await self._delivery_queue.requeue(queued)
+
+    async def _run_worker(self):
+        while True:
+            queued = await self._delivery_queue.get()
+            try:
+                if self._coalescer.should_coalesce(queued):
+                    self._coalescer.add(queued)
+                else:
+                    await self._deliver(queued)
+            except Exception as e:
+                print(f"Unexpected error while delivering '{queued.delivery_id}': {e}")
+            finally:
+                self._delivery_queue.task_done()
+
+    async def _deliver(self, queued: QueuedNotification):
+        with start_trace('deliver') as span:
+            if span.is_recording:
+                span.set_attribute('delivery.id', queued.delivery_id)
+            await self._deliver_in_scope(queued)
+
+    async def _deliver_in_scope(self, queued: QueuedNotification):
+        async with self._scope_factory.create_async_scope() as scope:
+            publishers = [p for p in self._router.get_publishers(queued.notification, scope.service_provider)
+                          if p.name not in queued.delivered_publishers]
+            delivery_ids = (queued.delivery_id, *queued.merged_delivery_ids)
+            if not publishers:
+                await self._complete(delivery_ids)
+                return
+
+            undelivered = {p.name for p in publishers}
+            on_settled = functools.partial(self._on_settled, delivery_ids, undelivered)
+            await self._dispatcher.dispatch(queued.notification, publishers, on_settled, on_abandoned=on_settled)
+
+        if undelivered:
+            print(f"Delivery '{queued.delivery_id}' failed for {len(undelivered)} of {len(publishers)} "
+                  f"publisher(s) on the first attempt")
+
+    async def _on_settled(self, delivery_ids: tuple[str, ...], undelivered: set[str], publisher_name: str):
+        undelivered.discard(publisher_name)
+        if not undelivered:
+            await self._complete(delivery_ids)
+            return
+
+        for delivery_id in delivery_ids:
+            await self._outbox.mark_delivered(delivery_id, (publisher_name,))
+
+    async def _complete(self, delivery_ids: tuple[str, ...]):
+        for delivery_id in delivery_ids:
+            await self._outbox.complete(delivery_id)
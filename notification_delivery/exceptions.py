@@ -0,0 +1,8 @@
+class NotificationDeliveryException(Exception):
+    def __init__(self, error_message: str):
+        super().__init__(error_message)
+
+
+class OutboxClosedError(NotificationDeliveryException):
+    def __init__(self):
+        super().__init__("The outbox was closed")
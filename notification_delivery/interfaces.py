@@ -0,0 +1,17 @@
+from typing import Protocol, Iterable, Sequence
+
+from .models import QueuedNotification
+
+
+class INotificationOutbox(Protocol):
+    async def append(self, queued: QueuedNotification) -> None:
+        ...
+
+    async def mark_delivered(self, delivery_id: str, publisher_names: Iterable[str]) -> None:
+        ...
+
+    async def complete(self, delivery_id: str) -> None:
+        ...
+
+    async def load_pending(self) -> Sequence[QueuedNotification]:
+        ...
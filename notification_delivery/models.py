@@ -0,0 +1,11 @@
+from typing import NamedTuple
+
+from models import Notification
+
+
+class QueuedNotification(NamedTuple):
+    delivery_id: str
+    notification: Notification
+    delivered_publishers: frozenset[str] = frozenset()
+    coalesced: bool = False
+    merged_delivery_ids: tuple[str, ...] = ()
@@ -0,0 +1,82 @@
+import asyncio
+from typing import Sequence
+
+from configuration import IOptionsMonitor
+from models import NotificationDigest
+from notification_routing import NotificationRouter
+from .configs import CoalescingConfig
+from .delivery_queue import DeliveryQueue
+from .models import QueuedNotification
+
+type _GroupKey = tuple[str, str | None, tuple[str, ...] | None]
+
+_SEVERITY_ORDER = ('debug', 'info', 'notice', 'warn', 'warning', 'error', 'critical', 'fatal')
+
+
+class NotificationCoalescer:
+    def __init__(self, config_monitor: IOptionsMonitor[CoalescingConfig], delivery_queue: DeliveryQueue,
+                 router: NotificationRouter):
+        self._config_monitor = config_monitor
+        self._delivery_queue = delivery_queue
+        self._router = router
+        self._groups: dict[_GroupKey, list[QueuedNotification]] = {}
+        self._timers: dict[_GroupKey, asyncio.TimerHandle] = {}
+        self._flushes: set[asyncio.Task] = set()
+
+    def should_coalesce(self, queued: QueuedNotification) -> bool:
+        return self._config_monitor.current_value.enabled and not queued.coalesced and not queued.delivered_publishers
+
+    def add(self, queued: QueuedNotification):
+        config = self._config_monitor.current_value
+        notification = queued.notification
+        key = (notification.source, notification.severity.lower() if config.per_severity else None,
+               self._router.route(notification))
+        group = self._groups.setdefault(key, [])
+        group.append(queued)
+
+        if len(group) >= config.max_batch_size:
+            self._flush(key)
+        elif key not in self._timers:
+            self._timers[key] = asyncio.get_running_loop().call_later(config.window, self._flush, key)
+
+    async def flush_all(self):
+        for key in list(self._groups.keys()):
+            self._flush(key)
+
+        await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    def _flush(self, key: _GroupKey):
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        group = self._groups.pop(key, None)
+        if not group:
+            return
+
+        task = asyncio.create_task(self._delivery_queue.requeue(_merge(group)))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+
+def _merge(group: Sequence[QueuedNotification]) -> QueuedNotification:
+    first = group[0]
+    if len(group) == 1:
+        return first._replace(coalesced=True)
+
+    notifications = [q.notification for q in group]
+    source = first.notification.source
+    severity = max((n.severity for n in notifications), key=_get_severity_rank)
+    digest = NotificationDigest(source=source,
+                                title=f'{len(notifications)} notifications from {source}',
+                                severity=severity,
+                                message='\n'.join(f'[{n.severity}] {n.title}' for n in notifications),
+                                notifications=notifications)
+
+    return QueuedNotification(first.delivery_id, digest, coalesced=True,
+                              merged_delivery_ids=tuple(q.delivery_id for q in group[1:]))
+
+
+def _get_severity_rank(severity: str) -> int:
+    severity = severity.lower()
+    return _SEVERITY_ORDER.index(severity) if severity in _SEVERITY_ORDER else -1
@@ -0,0 +1,61 @@
+import time
+from collections import Counter, OrderedDict
+
+from configuration import IOptionsMonitor
+from metrics import MetricsRegistry
+from models import Notification
+from .configs import DeduplicationConfig
+
+
+class NotificationDeduplicator:
+    def __init__(self, config_monitor: IOptionsMonitor[DeduplicationConfig], metrics: MetricsRegistry):
+        self._config_monitor = config_monitor
+        self._expirations: OrderedDict[int, float] = OrderedDict()
+        self._suppressed_per_source: Counter[str] = Counter()
+        self._suppressed = metrics.counter('notifications_suppressed', 'Duplicate notifications suppressed, per source',
+                                           ('source',))
+
+    @property
+    def size(self) -> int:
+        return len(self._expirations)
+
+    @property
+    def suppressed_count(self) -> int:
+        return self._suppressed_per_source.total()
+
+    @property
+    def suppressed_per_source(self) -> dict[str, int]:
+        return dict(self._suppressed_per_source)
+
+    def is_duplicate(self, notification: Notification) -> bool:
+        config = self._config_monitor.current_value
+        if not config.enabled:
+            return False
+
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        fingerprint = _get_fingerprint(notification)
+        if fingerprint in self._expirations:
+            self._suppressed_per_source[notification.source] += 1
+            self._suppressed.labels(notification.source).inc()
+            return True
+
+        self._expirations[fingerprint] = now + config.ttl
+        while len(self._expirations) > config.max_entries:
+            self._expirations.popitem(last=False)
+
+        return False
+
+    def _evict_expired(self, now: float):
+        expirations = self._expirations
+        while expirations:
+            fingerprint, expires_at = next(iter(expirations.items()))
+            if expires_at > now:
+                return
+            del expirations[fingerprint]
+
+
+def _get_fingerprint(notification: Notification) -> int:
+    message = ' '.join(notification.message.split()).casefold()
+    return hash((notification.source, notification.title, notification.severity.casefold(), message))
@@ -0,0 +1,169 @@
+import asyncio
+import random
+import time
+from typing import Sequence, Callable, Awaitable, NamedTuple
+
+from configuration import IOptionsMonitor
+from dependency_injection import IServiceScopeFactory
+from metrics import MetricsRegistry, HistogramValue, CounterValue
+from models import Notification
+from notification_publishers import NotificationPublisher, ProcessingResult, RetryLaterError
+from .circuit_breaker import CircuitBreaker, CircuitBreakers
+from .configs import RetryConfig, RetryPolicy, DeadlineConfig
+from .rate_limiter import RateLimiter
+from .retry_scheduler import RetryScheduler
+
+type DeliveredCallback = Callable[[str], Awaitable[None]]
+type AbandonedCallback = Callable[[str], Awaitable[None]]
+
+_RETRYABLE_RESULTS = (ProcessingResult.Fail, ProcessingResult.CircuitOpen, ProcessingResult.Timeout,
+                      ProcessingResult.RateLimited)
+_FAILED_RESULTS = (ProcessingResult.Fail, ProcessingResult.Timeout)
+
+
+class _PendingRetry(NamedTuple):
+    notification: Notification
+    publisher_name: str
+    attempt: int
+    on_delivered: DeliveredCallback | None
+    on_abandoned: AbandonedCallback | None
+
+
+class _PublisherMetrics(NamedTuple):
+    latency: HistogramValue
+    results: dict[ProcessingResult, CounterValue]
+
+
+class NotificationDispatcher:
+    def __init__(self, retry_config_monitor: IOptionsMonitor[RetryConfig],
+                 deadline_config_monitor: IOptionsMonitor[DeadlineConfig], retry_scheduler: RetryScheduler,
+                 rate_limiter: RateLimiter, circuit_breakers: CircuitBreakers, scope_factory: IServiceScopeFactory,
+                 metrics: MetricsRegistry):
+        self._retry_config_monitor = retry_config_monitor
+        self._deadline_config_monitor = deadline_config_monitor
+        self._retry_scheduler = retry_scheduler
+        self._rate_limiter = rate_limiter
+        self._circuit_breakers = circuit_breakers
+        self._scope_factory = scope_factory
+        self._latency = metrics.histogram('notification_publish_duration_seconds',
+                                          'Time spent publishing a notification, per publisher', ('publisher',))
+        self._results = metrics.counter('notification_publish_results',
+                                        'Publishing attempts by publisher and result', ('publisher', 'result'))
+        self._publisher_metrics: dict[str, _PublisherMetrics] = {}
+
+    def get_request_deadline(self) -> float:
+        return asyncio.get_running_loop().time() + self._deadline_config_monitor.current_value.request_timeout
+
+    async def dispatch(self, notification: Notification, notification_publishers: Sequence[NotificationPublisher],
+                       on_delivered: DeliveredCallback | None = None,
+                       deadline: float | None = None,
+                       on_abandoned: AbandonedCallback | None = None) -> Sequence[ProcessingResult]:
+        return await asyncio.gather(*(self._process(p, notification, 1, on_delivered, on_abandoned, deadline)
+                                      for p in notification_publishers))
+
+    async def _process(self, publisher: NotificationPublisher, notification: Notification, attempt: int,
+                       on_delivered: DeliveredCallback | None, on_abandoned: AbandonedCallback | None,
+                       deadline: float | None = None) -> ProcessingResult:
+        breaker = self._circuit_breakers.get(publisher.name) if self._circuit_breakers.enabled else None
+        destination = publisher.get_destination(notification)
+        if not await self._rate_limiter.acquire(publisher.name, destination, deadline):
+            print(f"Publisher '{publisher.name}' is rate limited past the deadline for '{notification.title}'")
+            result, retry_after = ProcessingResult.RateLimited, None
+        elif breaker is not None and not breaker.allow_request():
+            self._rate_limiter.release(publisher.name, destination)
+            result, retry_after = ProcessingResult.CircuitOpen, breaker.retry_in
+        else:
+            result, retry_after = ProcessingResult.Fail, None
+            start_time = time.perf_counter()
+            try:
+                result, retry_after = await self._publish(publisher, notification, deadline)
+            finally:
+                self._get_publisher_metrics(publisher.name).latency.observe(time.perf_counter() - start_time)
+                if breaker is not None:
+                    _record_outcome(breaker, result)
+
+        result_counter = self._get_publisher_metrics(publisher.name).results.get(result, None)
+        if result_counter is not None:
+            result_counter.inc()
+
+        if on_delivered is None:
+            return result
+
+        if result in _RETRYABLE_RESULTS:
+            await self._schedule_retry(_PendingRetry(notification, publisher.name, attempt, on_delivered,
+                                                     on_abandoned), retry_after)
+        else:
+            await on_delivered(publisher.name)
+
+        return result
+
+    async def _publish(self, publisher: NotificationPublisher, notification: Notification,
+                       deadline: float | None) -> tuple[ProcessingResult, float | None]:
+        publisher_deadline = self._get_publisher_deadline(publisher.name)
+        if deadline is not None:
+            publisher_deadline = min(publisher_deadline, deadline)
+
+        try:
+            async with asyncio.timeout_at(publisher_deadline):
+                return await publisher.process(notification), None
+        except RetryLaterError as e:
+            return ProcessingResult.Fail, e.retry_after
+        except TimeoutError:
+            print(f"Publisher '{publisher.name}' missed its deadline for '{notification.title}'")
+            return ProcessingResult.Timeout, None
+
+    def _get_publisher_metrics(self, publisher_name: str) -> _PublisherMetrics:
+        publisher_metrics = self._publisher_metrics.get(publisher_name, None)
+        if publisher_metrics is None:
+            publisher_metrics = self._publisher_metrics[publisher_name] = _PublisherMetrics(
+                self._latency.labels(publisher_name),
+                {result: self._results.labels(publisher_name, result.name) for result in ProcessingResult})
+
+        return publisher_metrics
+
+    def _get_publisher_deadline(self, publisher_name: str) -> float:
+        deadline_config = self._deadline_config_monitor.current_value
+        timeout = deadline_config.publisher_timeouts.get(publisher_name, deadline_config.publisher_timeout)
+        return asyncio.get_running_loop().time() + timeout
+
+    async def _schedule_retry(self, retry: _PendingRetry, retry_after: float | None):
+        retry_config = self._retry_config_monitor.current_value
+        policy = retry_config.publisher_policies.get(retry.publisher_name, retry_config.default_policy)
+        if retry.attempt >= policy.max_attempts:
+            print(f"Giving up on publisher '{retry.publisher_name}' for '{retry.notification.title}' "
+                  f"after {retry.attempt} attempt(s)")
+            await _abandon(retry)
+            return
+
+        delay = retry_after if retry_after is not None else _get_backoff_delay(policy, retry.attempt)
+        next_retry = retry._replace(attempt=retry.attempt + 1)
+        self._retry_scheduler.schedule(delay, lambda: self._retry(next_retry))
+
+    async def _retry(self, retry: _PendingRetry):
+        async with self._scope_factory.create_async_scope() as scope:
+            publisher = scope.service_provider.get_keyed_service(NotificationPublisher, retry.publisher_name)
+            if publisher is None:
+                print(f"Dropping the retry of '{retry.notification.title}', "
+                      f"publisher '{retry.publisher_name}' is no longer registered")
+                await _abandon(retry)
+                return
+
+            await self._process(publisher, retry.notification, retry.attempt, retry.on_delivered,
+                                retry.on_abandoned)
+
+
+async def _abandon(retry: _PendingRetry):
+    if retry.on_abandoned is not None:
+        await retry.on_abandoned(retry.publisher_name)
+
+
+def _record_outcome(breaker: CircuitBreaker, result: ProcessingResult):
+    if result in _FAILED_RESULTS:
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+
+
+def _get_backoff_delay(policy: RetryPolicy, attempt: int) -> float:
+    delay = min(policy.max_delay, policy.base_delay * 2 ** (attempt - 1))
+    return delay - random.uniform(0, delay * policy.jitter)
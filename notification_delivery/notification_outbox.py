@@ -0,0 +1,165 @@
+import asyncio
+import sqlite3
+import time
+from typing import Iterable, Sequence, NamedTuple
+
+from models import Notification
+from .configs import DeliveryConfig
+from .exceptions import OutboxClosedError
+from .models import QueuedNotification
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS outbox ("
+    "delivery_id TEXT PRIMARY KEY, notification TEXT NOT NULL, accepted_at REAL NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS outbox_progress ("
+    "delivery_id TEXT NOT NULL, publisher TEXT NOT NULL, PRIMARY KEY (delivery_id, publisher))",
+)
+
+
+class _Write(NamedTuple):
+    statement: str
+    parameters: tuple[object, ...]
+
+
+class NullOutbox:
+    async def append(self, queued: QueuedNotification) -> None:
+        pass
+
+    async def mark_delivered(self, delivery_id: str, publisher_names: Iterable[str]) -> None:
+        pass
+
+    async def complete(self, delivery_id: str) -> None:
+        pass
+
+    async def load_pending(self) -> Sequence[QueuedNotification]:
+        return ()
+
+
+class SqliteOutbox:
+    def __init__(self, config: DeliveryConfig):
+        self._path = config.outbox_path
+        self._flush_interval = config.outbox_flush_interval
+        self._max_batch_size = config.outbox_max_batch_size
+        self._connection: sqlite3.Connection | None = None
+        self._open_lock = asyncio.Lock()
+        self._pending_writes: list[tuple[_Write, asyncio.Future | None]] = []
+        self._flush_requested = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        self._closing = False
+
+    async def append(self, queued: QueuedNotification) -> None:
+        await self._write(_Write("INSERT OR REPLACE INTO outbox VALUES (?, ?, ?)",
+                                 (queued.delivery_id, queued.notification.model_dump_json(), time.time())),
+                          wait=True)
+
+    async def mark_delivered(self, delivery_id: str, publisher_names: Iterable[str]) -> None:
+        for publisher_name in publisher_names:
+            await self._write(_Write("INSERT OR IGNORE INTO outbox_progress VALUES (?, ?)",
+                                     (delivery_id, publisher_name)))
+
+    async def complete(self, delivery_id: str) -> None:
+        await self._write(_Write("DELETE FROM outbox_progress WHERE delivery_id = ?", (delivery_id,)))
+        await self._write(_Write("DELETE FROM outbox WHERE delivery_id = ?", (delivery_id,)))
+
+    async def load_pending(self) -> Sequence[QueuedNotification]:
+        await self._ensure_open()
+        return await asyncio.to_thread(self._read_pending)
+
+    async def aclose(self):
+        self._closing = True
+        if self._flusher is None:
+            return
+
+        self._flush_requested.set()
+        await self._flusher
+        self._flusher = None
+
+        if self._pending_writes:
+            print(f'Dropping {len(self._pending_writes)} outbox entries that could not be written before closing')
+            self._pending_writes.clear()
+
+        self._connection.close()
+        self._connection = None
+
+    async def _write(self, write: _Write, wait: bool = False):
+        await self._ensure_open()
+
+        future = asyncio.get_running_loop().create_future() if wait else None
+        self._pending_writes.append((write, future))
+        self._flush_requested.set()
+
+        if future is not None:
+            await future
+
+    async def _ensure_open(self):
+        if self._closing:
+            raise OutboxClosedError()
+        if self._connection is not None:
+            return
+
+        async with self._open_lock:
+            if self._closing:
+                raise OutboxClosedError()
+            if self._connection is None:
+                self._connection = await asyncio.to_thread(self._connect)
+                self._flusher = asyncio.create_task(self._run_flusher())
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self._path, check_same_thread=False, isolation_level=None)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            connection.execute(statement)
+        return connection
+
+    async def _run_flusher(self):
+        while not self._closing:
+            await self._flush_requested.wait()
+            if not self._closing and len(self._pending_writes) < self._max_batch_size:
+                await asyncio.sleep(self._flush_interval)
+            await self._flush()
+
+    async def _flush(self):
+        self._flush_requested.clear()
+        batch, self._pending_writes = self._pending_writes, []
+        if not batch:
+            return
+
+        try:
+            await asyncio.to_thread(self._commit, [write for write, _ in batch])
+        except Exception as e:
+            retained = [(write, future) for write, future in batch if future is None]
+            print(f'Failed to write {len(batch)} outbox entries, retrying {len(retained)} of them: {e}')
+            for _, future in batch:
+                if future is not None and not future.done():
+                    future.set_exception(e)
+
+            self._pending_writes[:0] = retained
+            if retained:
+                self._flush_requested.set()
+            return
+
+        for _, future in batch:
+            if future is not None and not future.done():
+                future.set_result(None)
+
+    def _commit(self, writes: Sequence[_Write]):
+        connection = self._connection
+        connection.execute("BEGIN")
+        try:
+            for write in writes:
+                connection.execute(write.statement, write.parameters)
+        except:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _read_pending(self) -> Sequence[QueuedNotification]:
+        progress: dict[str, set[str]] = {}
+        for delivery_id, publisher in self._connection.execute("SELECT delivery_id, publisher FROM outbox_progress"):
+            progress.setdefault(delivery_id, set()).add(publisher)
+
+        rows = self._connection.execute("SELECT delivery_id, notification FROM outbox ORDER BY accepted_at")
+        return [QueuedNotification(delivery_id, Notification.model_validate_json(notification),
+                                   frozenset(progress.get(delivery_id, ())))
+                for delivery_id, notification in rows]
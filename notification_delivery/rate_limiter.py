@@ -0,0 +1,88 @@
+import asyncio
+import time
+
+from configuration import IOptionsMonitor
+from .configs import RateLimitConfig, RateLimitPolicy
+
+
+class TokenBucket:
+    def __init__(self, policy: RateLimitPolicy):
+        self._rate = policy.rate
+        self._burst = policy.burst
+        self._tokens = float(policy.burst)
+        self._updated_at = time.monotonic()
+
+    def reserve(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+        self._tokens -= 1
+
+        return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def refund(self):
+        self._tokens = min(self._burst, self._tokens + 1)
+
+
+class RateLimiter:
+    def __init__(self, config_monitor: IOptionsMonitor[RateLimitConfig]):
+        self._set_config(config_monitor.current_value)
+        config_monitor.on_change(self._set_config)
+
+    async def acquire(self, publisher_name: str, destination: str | None = None,
+                      deadline: float | None = None) -> bool:
+        buckets = self._get_buckets(publisher_name, destination)
+        delay = max((bucket.reserve() for bucket in buckets), default=0.0)
+        if delay <= 0:
+            return True
+
+        if deadline is not None and asyncio.get_running_loop().time() + delay > deadline:
+            for bucket in buckets:
+                bucket.refund()
+            return False
+
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            for bucket in buckets:
+                bucket.refund()
+            raise
+
+        return True
+
+    def release(self, publisher_name: str, destination: str | None = None):
+        for bucket in self._get_buckets(publisher_name, destination):
+            bucket.refund()
+
+    def _set_config(self, config: RateLimitConfig):
+        self._config = config
+        self._publisher_buckets: dict[str, TokenBucket] = {name: TokenBucket(policy) for name, policy
+                                                           in config.publisher_limits.items()}
+        self._destination_buckets: dict[tuple[str, str], TokenBucket] = {}
+
+    def _get_buckets(self, publisher_name: str, destination: str | None) -> list[TokenBucket]:
+        buckets = []
+
+        publisher_bucket = self._publisher_buckets.get(publisher_name, None)
+        if publisher_bucket is not None:
+            buckets.append(publisher_bucket)
+
+        destination_bucket = self._get_destination_bucket(publisher_name, destination)
+        if destination_bucket is not None:
+            buckets.append(destination_bucket)
+
+        return buckets
+
+    def _get_destination_bucket(self, publisher_name: str, destination: str | None) -> TokenBucket | None:
+        if destination is None:
+            return None
+
+        key = (publisher_name, destination)
+        bucket = self._destination_buckets.get(key, None)
+        if bucket is None:
+            policy = self._config.destination_limits.get(publisher_name, None)
+            if policy is None:
+                return None
+            bucket = self._destination_buckets[key] = TokenBucket(policy)
+
+        return bucket
@@ -0,0 +1,58 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+from typing import Callable, Awaitable
+
+type RetryCallback = Callable[[], Awaitable[None]]
+
+
+class RetryScheduler:
+    def __init__(self):
+        self._heap: list[tuple[float, int, RetryCallback]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_due: float | None = None
+        self._running: set[asyncio.Task] = set()
+
+    @property
+    def pending(self) -> int:
+        return len(self._heap)
+
+    def schedule(self, delay: float, callback: RetryCallback):
+        loop = asyncio.get_running_loop()
+        due = loop.time() + max(delay, 0.0)
+        heapq.heappush(self._heap, (due, next(self._sequence), callback))
+
+        if self._timer_due is None or due < self._timer_due:
+            self._arm_timer(loop, due)
+
+    async def aclose(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = self._timer_due = None
+        self._heap.clear()
+
+        for task in self._running:
+            task.cancel()
+        await asyncio.gather(*self._running, return_exceptions=True)
+
+    def _arm_timer(self, loop: asyncio.AbstractEventLoop, due: float):
+        if self._timer is not None:
+            self._timer.cancel()
+
+        self._timer = loop.call_at(due, self._on_timer, loop, context=contextvars.Context())
+        self._timer_due = due
+
+    def _on_timer(self, loop: asyncio.AbstractEventLoop):
+        self._timer = self._timer_due = None
+        now = loop.time()
+
+        while self._heap and self._heap[0][0] <= now:
+            _, _, callback = heapq.heappop(self._heap)
+            task = loop.create_task(callback(), context=contextvars.Context())
+            self._running.add(task)
+            task.add_done_callback(self._running.discard)
+
+        if self._heap:
+            self._arm_timer(loop, self._heap[0][0])
@@ -0,0 +1,7 @@
+from .batch_processor import BatchResult, ItemHandler, process_batch
+from .batch_reader import BatchItem, read_batch, is_ndjson_content_type
+from .configs import BatchConfig
+from .exceptions import NotificationIngestException, BatchFormatError, BatchTooLargeError
+
+__all__ = ('BatchConfig', 'BatchItem', 'read_batch', 'is_ndjson_content_type', 'process_batch', 'BatchResult',
+           'ItemHandler', 'NotificationIngestException', 'BatchFormatError', 'BatchTooLargeError')
@@ -0,0 +1,51 @@
+import asyncio
+from typing import AsyncIterable, Awaitable, Callable, NamedTuple
+
+from models import Notification
+from .batch_reader import BatchItem
+from .configs import BatchConfig
+from .exceptions import BatchTooLargeError, NotificationIngestException
+
+type ItemHandler = Callable[[Notification], Awaitable[dict[str, object]]]
+
+
+class BatchResult(NamedTuple):
+    results: list[dict[str, object]]
+    error: str | None = None
+
+
+async def process_batch(items: AsyncIterable[BatchItem], handler: ItemHandler, config: BatchConfig) -> BatchResult:
+    results: list[dict[str, object]] = []
+    semaphore = asyncio.Semaphore(config.max_concurrency)
+    tasks: set[asyncio.Task] = set()
+    error: str | None = None
+
+    async def handle(item: BatchItem):
+        try:
+            results[item.index] = await handler(item.notification)
+        except Exception as e:
+            print(f"Failed to process batch item {item.index}: {e!r}")
+            results[item.index] = {"status": "failed", "error": str(e)}
+        finally:
+            semaphore.release()
+
+    try:
+        async for item in items:
+            if item.index >= config.max_items:
+                raise BatchTooLargeError(config.max_items)
+
+            if item.notification is None:
+                results.append({"status": "invalid notification", "error": item.error})
+                continue
+
+            results.append({})
+            await semaphore.acquire()
+            task = asyncio.create_task(handle(item))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+    except NotificationIngestException as e:
+        error = str(e)
+    finally:
+        await asyncio.gather(*tasks)
+
+    return BatchResult(results, error)
@@ -0,0 +1,133 @@
+import codecs
+import json
+from typing import AsyncIterable, AsyncIterator, NamedTuple, Any
+
+from pydantic import ValidationError
+
+from models import Notification
+from .exceptions import BatchFormatError
+
+_NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/jsonl', 'application/json-seq')
+_WHITESPACE = ' \t\r\n\x1e'
+_LINE_WHITESPACE = _WHITESPACE.encode()
+
+
+class BatchItem(NamedTuple):
+    index: int
+    notification: Notification | None
+    error: str | None = None
+
+
+class _InvalidValue(NamedTuple):
+    reason: str
+
+
+class _TextStream:
+    def __init__(self, chunks: AsyncIterable[bytes]):
+        self._chunks = aiter(chunks)
+        self._decoder = codecs.getincrementaldecoder('utf-8')()
+        self.buffer = ''
+        self.position = 0
+
+    async def read_more(self) -> bool:
+        chunk = await anext(self._chunks, None)
+        if chunk is None:
+            return False
+
+        self.buffer = self.buffer[self.position:] + self._decoder.decode(chunk)
+        self.position = 0
+        return True
+
+    async def peek(self) -> str | None:
+        while True:
+            buffer, position = self.buffer, self.position
+            while position < len(buffer) and buffer[position] in _WHITESPACE:
+                position += 1
+            self.position = position
+
+            if position < len(buffer):
+                return buffer[position]
+            if not await self.read_more():
+                return None
+
+
+def is_ndjson_content_type(content_type: str) -> bool:
+    return content_type.split(';', 1)[0].strip().lower() in _NDJSON_CONTENT_TYPES
+
+
+async def read_batch(chunks: AsyncIterable[bytes], ndjson: bool) -> AsyncIterator[BatchItem]:
+    values = _read_ndjson_values(chunks) if ndjson else _read_json_array_values(chunks)
+    index = 0
+    async for value in values:
+        yield _validate_item(index, value)
+        index += 1
+
+
+def _validate_item(index: int, value: Any) -> BatchItem:
+    if isinstance(value, _InvalidValue):
+        return BatchItem(index, None, value.reason)
+
+    try:
+        return BatchItem(index, Notification.model_validate(value))
+    except ValidationError as e:
+        return BatchItem(index, None, str(e))
+
+
+async def _read_ndjson_values(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    buffer = b''
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            line = line.strip(_LINE_WHITESPACE)
+            if line:
+                yield _parse_line(line)
+
+    buffer = buffer.strip(_LINE_WHITESPACE)
+    if buffer:
+        yield _parse_line(buffer)
+
+
+def _parse_line(line: bytes) -> Any:
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return _InvalidValue(f'invalid JSON line: {e}')
+
+
+async def _read_json_array_values(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    stream = _TextStream(chunks)
+    decoder = json.JSONDecoder()
+
+    if await stream.peek() != '[':
+        raise BatchFormatError('expected a JSON array')
+    stream.position += 1
+
+    if await stream.peek() == ']':
+        stream.position += 1
+    else:
+        while True:
+            yield await _decode_value(stream, decoder)
+
+            char = await stream.peek()
+            stream.position += 1
+            if char == ']':
+                break
+            if char != ',':
+                raise BatchFormatError("expected ',' or ']' between array items")
+
+    if await stream.peek() is not None:
+        raise BatchFormatError('unexpected data after the JSON array')
+
+
+async def _decode_value(stream: _TextStream, decoder: json.JSONDecoder) -> Any:
+    while True:
+        if await stream.peek() is None:
+            raise BatchFormatError('unexpected end of body')
+
+        try:
+            value, stream.position = decoder.raw_decode(stream.buffer, stream.position)
+            return value
+        except json.JSONDecodeError as e:
+            if not await stream.read_more():
+                raise BatchFormatError(f'invalid JSON item: {e.msg}')
@@ -0,0 +1,6 @@
+from typing import NamedTuple
+
+
+class BatchConfig(NamedTuple):
+    max_concurrency: int = 16
+    max_items: int = 1000
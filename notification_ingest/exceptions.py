@@ -0,0 +1,15 @@
+class NotificationIngestException(Exception):
+    def __init__(self, error_message: str):
+        super().__init__(error_message)
+
+
+class BatchFormatError(NotificationIngestException):
+    def __init__(self, reason: str):
+        super().__init__(f"Malformed notification batch: {reason}")
+        self.reason = reason
+
+
+class BatchTooLargeError(NotificationIngestException):
+    def __init__(self, max_items: int):
+        super().__init__(f"Notification batch has more than {max_items} items")
+        self.max_items = max_items
@@ -1,6 +1,10 @@
 from .configs import GotifyConfig, TelegramConfig
-from .notification_publisher import NotificationPublisher, ProcessingResult
+from .exceptions import NotificationPublisherException, RetryLaterError
+from .gotify_http_client import GotifyHttpClient
+from .notification_publisher import NotificationPublisher, ProcessingResult, get_publisher_name
 from .notifications_publishers_finder import find_notification_publishers
+from .telegram_bot_client import TelegramBotClient
 
 __all__ = ('NotificationPublisher', 'ProcessingResult', 'find_notification_publishers', 'GotifyConfig',
-           'TelegramConfig')
+           'TelegramConfig', 'TelegramBotClient', 'GotifyHttpClient', 'get_publisher_name',
+           'NotificationPublisherException', 'RetryLaterError')
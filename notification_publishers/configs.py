@@ -5,8 +5,16 @@ class GotifyConfig(NamedTuple):
     server_url: str
     general_api_token: str
     api_token_per_source: dict[str, str]
+    max_connections: int = 10
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+    connect_timeout: float = 5.0
+    request_timeout: float = 10.0
 
 
 class TelegramConfig(NamedTuple):
     bot_token: str
     chat_id: str
+    connection_pool_size: int = 8
+    request_timeout: float = 10.0
+    api_base_url: str = 'https://api.telegram.org/bot'
@@ -0,0 +1,10 @@
+class NotificationPublisherException(Exception):
+    def __init__(self, error_message: str):
+        super().__init__(error_message)
+
+
+class RetryLaterError(NotificationPublisherException):
+    def __init__(self, retry_after: float | None = None):
+        super().__init__("Backend asked to retry later" if retry_after is None
+                         else f"Backend asked to retry in {retry_after} seconds")
+        self.retry_after = retry_after
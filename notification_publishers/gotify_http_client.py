@@ -0,0 +1,55 @@
+import asyncio
+
+import httpx
+
+from configuration import IOptionsMonitor
+from .configs import GotifyConfig
+from .leased_resource import LeasedResource
+
+
+def _create_client(config: GotifyConfig) -> httpx.AsyncClient:
+    limits = httpx.Limits(max_connections=config.max_connections,
+                          max_keepalive_connections=config.max_keepalive_connections,
+                          keepalive_expiry=config.keepalive_expiry)
+    timeout = httpx.Timeout(config.request_timeout, connect=config.connect_timeout)
+    base_url = config.server_url if '://' in config.server_url else f"https://{config.server_url}"
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=timeout)
+
+
+def _get_client_settings(config: GotifyConfig) -> tuple[object, ...]:
+    return (config.server_url, config.max_connections, config.max_keepalive_connections, config.keepalive_expiry,
+            config.connect_timeout, config.request_timeout)
+
+
+async def _close_when_drained(client: LeasedResource[httpx.AsyncClient]):
+    await client.drain()
+    await client.resource.aclose()
+
+
+class GotifyHttpClient:
+    def __init__(self, config_monitor: IOptionsMonitor[GotifyConfig]):
+        self._config = config_monitor.current_value
+        self._client = LeasedResource(_create_client(self._config))
+        self._closing_clients: set[asyncio.Task] = set()
+        config_monitor.on_change(self._on_config_changed)
+
+    async def post_message(self, api_token: str, payload: dict[str, object]) -> httpx.Response:
+        with self._client.lease() as client:
+            return await client.post('/message', params={'token': api_token}, json=payload)
+
+    async def aclose(self):
+        await asyncio.gather(*self._closing_clients, return_exceptions=True)
+        await _close_when_drained(self._client)
+
+    def _on_config_changed(self, config: GotifyConfig):
+        if _get_client_settings(config) == _get_client_settings(self._config):
+            self._config = config
+            return
+
+        loop = asyncio.get_running_loop()
+        previous_client, self._client = self._client, LeasedResource(_create_client(config))
+        self._config = config
+
+        task = loop.create_task(_close_when_drained(previous_client))
+        self._closing_clients.add(task)
+        task.add_done_callback(self._closing_clients.discard)
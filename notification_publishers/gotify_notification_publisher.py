@@ -1,13 +1,22 @@
-import requests_async
-
+from configuration import IOptionsMonitor
 from models import Notification
+from tracing import start_span
 from .configs import GotifyConfig
+from .exceptions import RetryLaterError
+from .gotify_http_client import GotifyHttpClient
 from .notification_publisher import NotificationPublisher, ProcessingResult
 
 
+_RETRY_LATER_STATUS_CODES = (429, 503)
+
+
 class GotifyNotificationPublisher(NotificationPublisher):
-    def __init__(self, config: GotifyConfig):
-        self._config = config
+    def __init__(self, config_monitor: IOptionsMonitor[GotifyConfig], http_client: GotifyHttpClient):
+        self._config_monitor = config_monitor
+        self._http_client = http_client
+
+    def get_destination(self, notification: Notification) -> str | None:
+        return self._get_api_token_for_source(notification.source) or None
 
     async def _process(self, notification: Notification) -> ProcessingResult:
         api_token = self._get_api_token_for_source(notification.source)
@@ -16,22 +25,33 @@ class GotifyNotificationPublisher(NotificationPublisher):
             print(f'Unable to find API token for source {notification.source}')
             return ProcessingResult.Skip
 
-        server_url = self._config.server_url
-        resp = await requests_async.post(f"https://{server_url}/message?token={api_token}", json={
-            "message": notification.message,
-            "priority": _severity_to_priority(notification.severity),
-            "title": notification.title
-        })
+        with start_span('post message'):
+            resp = await self._http_client.post_message(api_token, {
+                "message": notification.message,
+                "priority": _severity_to_priority(notification.severity),
+                "title": notification.title
+            })
+        if resp.status_code in _RETRY_LATER_STATUS_CODES:
+            raise RetryLaterError(_parse_retry_after(resp.headers.get('Retry-After')))
+
         return ProcessingResult.Success if resp.is_success else ProcessingResult.Fail
 
     def _get_api_token_for_source(self, source: str) -> str:
-        token = self._config.api_token_per_source.get(source, None)
+        config = self._config_monitor.current_value
+        token = config.api_token_per_source.get(source, None)
         if not token:
-            return self._config.general_api_token
+            return config.general_api_token
 
         return token
 
 
+def _parse_retry_after(retry_after: str | None) -> float | None:
+    if retry_after is None or not retry_after.strip().isdigit():
+        return None
+
+    return float(retry_after)
+
+
 def _severity_to_priority(severity: str) -> int:
     match severity.lower():
         case 'debug':
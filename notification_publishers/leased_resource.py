@@ -0,0 +1,29 @@
+import asyncio
+from contextlib import contextmanager
+from typing import Iterator
+
+
+class LeasedResource[T]:
+    def __init__(self, resource: T):
+        self._resource = resource
+        self._leases = 0
+        self._drained = asyncio.Event()
+        self._drained.set()
+
+    @property
+    def resource(self) -> T:
+        return self._resource
+
+    @contextmanager
+    def lease(self) -> Iterator[T]:
+        self._leases += 1
+        self._drained.clear()
+        try:
+            yield self._resource
+        finally:
+            self._leases -= 1
+            if self._leases == 0:
+                self._drained.set()
+
+    async def drain(self):
+        await self._drained.wait()
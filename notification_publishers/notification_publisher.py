@@ -2,21 +2,47 @@ from abc import ABC, abstractmethod
 from enum import Enum
 
 from models import Notification
+from tracing import start_span
+from .exceptions import RetryLaterError
 
 
 class ProcessingResult(Enum):
     Success = 0
     Fail = 1
     Skip = 2
+    CircuitOpen = 3
+    Timeout = 4
+    RateLimited = 5
 
 
 class NotificationPublisher(ABC):
+    @property
+    def name(self) -> str:
+        return get_publisher_name(type(self))
+
+    def get_destination(self, notification: Notification) -> str | None:
+        return None
+
     async def process(self, notification: Notification) -> ProcessingResult:
+        with start_span('publish') as span:
+            result = await self._process_safely(notification)
+            if span.is_recording:
+                span.set_attribute('publisher', self.name)
+                span.set_attribute('result', result.name)
+            return result
+
+    async def _process_safely(self, notification: Notification) -> ProcessingResult:
         try:
             return await self._process(notification)
-        except:
+        except RetryLaterError:
+            raise
+        except Exception:
             return ProcessingResult.Fail
 
     @abstractmethod
     async def _process(self, notification: Notification) -> ProcessingResult:
         ...
+
+
+def get_publisher_name(t: type[NotificationPublisher]) -> str:
+    return t.__name__.removesuffix(NotificationPublisher.__name__).lower() or t.__name__.lower()
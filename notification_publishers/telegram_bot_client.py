@@ -0,0 +1,74 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from telegram import Bot
+from telegram.request import HTTPXRequest
+
+from configuration import IOptionsMonitor
+from .configs import TelegramConfig
+from .leased_resource import LeasedResource
+
+
+def _create_bot(config: TelegramConfig) -> Bot:
+    request = HTTPXRequest(connection_pool_size=config.connection_pool_size,
+                           read_timeout=config.request_timeout,
+                           write_timeout=config.request_timeout,
+                           connect_timeout=config.request_timeout)
+    return Bot(token=config.bot_token, base_url=config.api_base_url, request=request)
+
+
+def _get_bot_settings(config: TelegramConfig) -> tuple[str, int, float, str]:
+    return config.bot_token, config.connection_pool_size, config.request_timeout, config.api_base_url
+
+
+async def _shutdown_when_drained(bot: LeasedResource[Bot]):
+    await bot.drain()
+    await bot.resource.shutdown()
+
+
+class TelegramBotClient:
+    def __init__(self, config_monitor: IOptionsMonitor[TelegramConfig]):
+        self._config = config_monitor.current_value
+        self._bot = LeasedResource(_create_bot(self._config))
+        self._initialization_lock = asyncio.Lock()
+        self._initialized_bot: Bot | None = None
+        self._retiring_bots: set[asyncio.Task] = set()
+        config_monitor.on_change(self._on_config_changed)
+
+    async def initialize(self):
+        with self._bot.lease() as bot:
+            await self._ensure_initialized(bot)
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Bot]:
+        with self._bot.lease() as bot:
+            await self._ensure_initialized(bot)
+            yield bot
+
+    async def aclose(self):
+        await asyncio.gather(*self._retiring_bots, return_exceptions=True)
+        await _shutdown_when_drained(self._bot)
+        self._initialized_bot = None
+
+    async def _ensure_initialized(self, bot: Bot):
+        if self._initialized_bot is bot:
+            return
+
+        async with self._initialization_lock:
+            if self._initialized_bot is not bot:
+                await bot.initialize()
+                self._initialized_bot = bot
+
+    def _on_config_changed(self, config: TelegramConfig):
+        if _get_bot_settings(config) == _get_bot_settings(self._config):
+            self._config = config
+            return
+
+        loop = asyncio.get_running_loop()
+        previous_bot, self._bot = self._bot, LeasedResource(_create_bot(config))
+        self._config = config
+
+        task = loop.create_task(_shutdown_when_drained(previous_bot))
+        self._retiring_bots.add(task)
+        task.add_done_callback(self._retiring_bots.discard)
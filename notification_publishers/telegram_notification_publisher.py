@@ -1,25 +1,39 @@
 import html
+from datetime import timedelta
 
-from telegram import Bot
-from telegram.error import TelegramError
+from telegram.error import TelegramError, RetryAfter
 
-from models import Notification
+from configuration import IOptionsMonitor
+from models import Notification, NotificationDigest
+from tracing import start_span
 from .configs import TelegramConfig
+from .exceptions import RetryLaterError
 from .notification_processor import get_short_message
 from .notification_publisher import NotificationPublisher, ProcessingResult
+from .telegram_bot_client import TelegramBotClient
 
 
 class TelegramNotificationPublisher(NotificationPublisher):
-    def __init__(self, config: TelegramConfig):
-        self._config = config
+    def __init__(self, config_monitor: IOptionsMonitor[TelegramConfig], bot_client: TelegramBotClient):
+        self._config_monitor = config_monitor
+        self._bot_client = bot_client
+
+    def get_destination(self, notification: Notification) -> str | None:
+        return self._config_monitor.current_value.chat_id
 
     async def _process(self, notification: Notification) -> ProcessingResult:
-        chat_id = self._config.chat_id
+        chat_id = self._config_monitor.current_value.chat_id
         try:
-            async with Bot(token=self._config.bot_token) as bot:
-                await bot.send_message(chat_id=chat_id, text=_generate_text_for_notification(notification),
-                                       parse_mode='HTML')
-                return ProcessingResult.Success
+            with start_span('render message'):
+                text = _generate_text_for_notification(notification)
+            async with self._bot_client.lease() as bot:
+                with start_span('send message'):
+                    await bot.send_message(chat_id=chat_id, text=text, parse_mode='HTML')
+            return ProcessingResult.Success
+        except RetryAfter as e:
+            retry_after = e.retry_after
+            raise RetryLaterError(retry_after.total_seconds() if isinstance(retry_after, timedelta)
+                                  else float(retry_after))
         except TelegramError as e:
             # Optional: Log the error or handle specific cases
             print(f"Telegram API error: {e}")
@@ -31,6 +45,9 @@ class TelegramNotificationPublisher(NotificationPublisher):
 
 
 def _generate_text_for_notification(notification: Notification):
+    if isinstance(notification, NotificationDigest):
+        return _generate_text_for_digest(notification)
+
     icon = _get_severity_icon(notification.severity.lower())
     source = notification.source
     title = html.escape(notification.title)
@@ -44,6 +61,18 @@ def _generate_text_for_notification(notification: Notification):
     )
 
 
+def _generate_text_for_digest(digest: NotificationDigest):
+    icon = _get_severity_icon(digest.severity.lower())
+    title = html.escape(digest.title)
+    lines = (f"{_get_severity_icon(n.severity.lower())} {html.escape(n.title)}" for n in digest.notifications)
+
+    return (
+        f"<b>{icon} {title}</b>\n"
+        f"<i>Source:</i> <code>{digest.source}</code>\n\n"
+        + "\n".join(lines)
+    )
+
+
 def _get_severity_icon(severity: str) -> str:
     match severity.lower():
         case 'info' | 'notice':
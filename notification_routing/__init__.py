@@ -0,0 +1,4 @@
+from .configs import RoutingConfig, RouteRule
+from .notification_router import NotificationRouter
+
+__all__ = ('RoutingConfig', 'RouteRule', 'NotificationRouter')
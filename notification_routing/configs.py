@@ -0,0 +1,15 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+
+class RouteRule(NamedTuple):
+    publishers: str
+    sources: str | None = None
+    severities: str | None = None
+    title_pattern: str | None = None
+
+
+class RoutingConfig(NamedTuple):
+    enabled: bool = False
+    routes: dict[str, RouteRule] = MappingProxyType({})
+    default_publishers: str | None = None
@@ -0,0 +1,117 @@
+import re
+from typing import Sequence, Iterable
+
+from configuration import IOptionsMonitor
+from dependency_injection import IServiceProvider
+from models import Notification, NotificationDigest
+from notification_publishers import NotificationPublisher
+from .configs import RoutingConfig, RouteRule
+
+
+def _split(values: str) -> tuple[str, ...]:
+    return tuple(dict.fromkeys(v.strip() for v in values.split(',') if v.strip()))
+
+
+def _merge_routes(routes: Iterable[tuple[str, ...] | None]) -> tuple[str, ...] | None:
+    publishers: dict[str, None] = {}
+    for route in routes:
+        if route is None:
+            return None
+        publishers.update(dict.fromkeys(route))
+
+    return tuple(publishers)
+
+
+class _RoutingTable:
+    def __init__(self, config: RoutingConfig):
+        self._enabled = config.enabled
+        self._default_publishers = None if config.default_publishers is None else _split(config.default_publishers)
+        self._rule_publishers: list[tuple[str, ...]] = []
+        self._title_patterns: list[re.Pattern | None] = []
+        self._source_masks: dict[str, int] = {}
+        self._severity_masks: dict[str, int] = {}
+        self._any_source_mask = 0
+        self._any_severity_mask = 0
+        self._pattern_mask = 0
+        self._routes_per_mask: dict[int, tuple[str, ...] | None] = {}
+
+        for rule in config.routes.values():
+            self._add_rule(rule)
+
+    def route(self, notification: Notification) -> tuple[str, ...] | None:
+        if not self._enabled:
+            return None
+
+        mask = ((self._source_masks.get(notification.source, 0) | self._any_source_mask) &
+                (self._severity_masks.get(notification.severity.casefold(), 0) | self._any_severity_mask))
+
+        patterns_mask = mask & self._pattern_mask
+        while patterns_mask:
+            bit = patterns_mask & -patterns_mask
+            if self._title_patterns[bit.bit_length() - 1].search(notification.title) is None:
+                mask &= ~bit
+            patterns_mask &= patterns_mask - 1
+
+        if mask not in self._routes_per_mask:
+            self._routes_per_mask[mask] = self._get_publishers_for_mask(mask)
+
+        return self._routes_per_mask[mask]
+
+    def _add_rule(self, rule: RouteRule):
+        bit = 1 << len(self._rule_publishers)
+        self._rule_publishers.append(_split(rule.publishers))
+
+        if rule.sources is None:
+            self._any_source_mask |= bit
+        else:
+            for source in _split(rule.sources):
+                self._source_masks[source] = self._source_masks.get(source, 0) | bit
+
+        if rule.severities is None:
+            self._any_severity_mask |= bit
+        else:
+            for severity in _split(rule.severities):
+                severity = severity.casefold()
+                self._severity_masks[severity] = self._severity_masks.get(severity, 0) | bit
+
+        if rule.title_pattern is None:
+            self._title_patterns.append(None)
+        else:
+            self._title_patterns.append(re.compile(rule.title_pattern))
+            self._pattern_mask |= bit
+
+    def _get_publishers_for_mask(self, mask: int) -> tuple[str, ...] | None:
+        if mask == 0:
+            return self._default_publishers
+
+        publishers: dict[str, None] = {}
+        for index, rule_publishers in enumerate(self._rule_publishers):
+            if mask & (1 << index):
+                publishers.update(dict.fromkeys(rule_publishers))
+
+        return tuple(publishers)
+
+
+class NotificationRouter:
+    def __init__(self, config_monitor: IOptionsMonitor[RoutingConfig]):
+        self._table = _RoutingTable(config_monitor.current_value)
+        config_monitor.on_change(self._on_config_changed)
+
+    def route(self, notification: Notification) -> tuple[str, ...] | None:
+        table = self._table
+        if isinstance(notification, NotificationDigest):
+            return _merge_routes(table.route(n) for n in notification.notifications)
+
+        return table.route(notification)
+
+    def get_publishers(self, notification: Notification,
+                       service_provider: IServiceProvider) -> Sequence[NotificationPublisher]:
+        names = self.route(notification)
+        if names is None:
+            return service_provider.get_services(NotificationPublisher)
+
+        publishers = (service_provider.get_keyed_service(NotificationPublisher, name) for name in names)
+        return [publisher for publisher in publishers if publisher is not None]
+
+    def _on_config_changed(self, config: RoutingConfig):
+        self._table = _RoutingTable(config)
@@ -0,0 +1,20 @@
+from typing import Callable
+
+
+class StaticOptionsMonitor[T]:
+    def __init__(self, value: T):
+        self._value = value
+        self._listeners: list[Callable[[T], None]] = []
+
+    @property
+    def current_value(self) -> T:
+        return self._value
+
+    def on_change(self, listener: Callable[[T], None]) -> Callable[[], None]:
+        self._listeners.append(listener)
+        return lambda: self._listeners.remove(listener)
+
+    def set(self, value: T):
+        self._value = value
+        for listener in tuple(self._listeners):
+            listener(value)
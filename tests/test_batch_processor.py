@@ -0,0 +1,28 @@
+import unittest
+
+from models import Notification
+from notification_ingest import BatchConfig, BatchItem, process_batch
+
+
+async def _items(count: int):
+    for i in range(count):
+        yield BatchItem(i, Notification(source='s', title=f't{i}', severity='info', message='m'))
+
+
+class ProcessBatchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_failing_item_is_reported_in_its_slot(self):
+        async def handler(notification: Notification) -> dict[str, object]:
+            if notification.title == 't1':
+                raise RuntimeError('publisher exploded')
+            return {"status": f"handled '{notification.title}'"}
+
+        batch = await process_batch(_items(3), handler, BatchConfig(max_concurrency=2))
+
+        self.assertIsNone(batch.error)
+        self.assertEqual({"status": "handled 't0'"}, batch.results[0])
+        self.assertEqual({"status": "failed", "error": 'publisher exploded'}, batch.results[1])
+        self.assertEqual({"status": "handled 't2'"}, batch.results[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
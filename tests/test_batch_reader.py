@@ -0,0 +1,32 @@
+import unittest
+
+from notification_ingest import read_batch
+
+
+async def _chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def _read(*chunks: bytes, ndjson: bool = True) -> list:
+    return [item async for item in read_batch(_chunks(*chunks), ndjson)]
+
+
+class ReadBatchTests(unittest.IsolatedAsyncioTestCase):
+    async def test_json_seq_records_are_parsed(self):
+        items = await _read(b'\x1e{"source": "s", "title": "t0", "severity": "info", "message": "m"}\n\x1e{"sou',
+                            b'rce": "s", "title": "t1", "severity": "info", "message": "m"}\n')
+
+        self.assertEqual([None, None], [item.error for item in items])
+        self.assertEqual(['t0', 't1'], [item.notification.title for item in items])
+
+    async def test_invalid_ndjson_line_is_reported_in_its_slot(self):
+        items = await _read(b'{"source": "s", "title": "t0", "severity": "info", "message": "m"}\n{oops\n')
+
+        self.assertIsNotNone(items[0].notification)
+        self.assertIsNone(items[1].notification)
+        self.assertIn('invalid JSON line', items[1].error)
+
+
+if __name__ == '__main__':
+    unittest.main()
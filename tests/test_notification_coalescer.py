@@ -0,0 +1,39 @@
+import unittest
+
+from metrics import MetricsRegistry
+from models import Notification, NotificationDigest
+from notification_delivery import CoalescingConfig, DeliveryConfig, DeliveryQueue, NotificationCoalescer, NullOutbox, \
+    QueuedNotification
+from notification_routing import NotificationRouter, RoutingConfig, RouteRule
+from tests.static_options_monitor import StaticOptionsMonitor
+
+
+def _queued(index: int, title: str) -> QueuedNotification:
+    return QueuedNotification(str(index), Notification(source='nas', title=title, severity='error', message='m'))
+
+
+class NotificationCoalescerTests(unittest.IsolatedAsyncioTestCase):
+    async def test_title_routes_survive_coalescing(self):
+        router = NotificationRouter(StaticOptionsMonitor(RoutingConfig(
+            enabled=True, routes={'disks': RouteRule(publishers='telegram', title_pattern='^disk')},
+            default_publishers='gotify')))
+        delivery_queue = DeliveryQueue(DeliveryConfig(), NullOutbox(), MetricsRegistry())
+        coalescer = NotificationCoalescer(StaticOptionsMonitor(CoalescingConfig(enabled=True)), delivery_queue,
+                                          router)
+
+        for index, title in enumerate(('disk sda failed', 'pool degraded', 'disk sdb failed', 'scrub finished')):
+            coalescer.add(_queued(index, title))
+        await coalescer.flush_all()
+
+        routes = {}
+        while delivery_queue.size:
+            digest = (await delivery_queue.get()).notification
+            self.assertIsInstance(digest, NotificationDigest)
+            routes[router.route(digest)] = [n.title for n in digest.notifications]
+
+        self.assertEqual({('telegram',): ['disk sda failed', 'disk sdb failed'],
+                          ('gotify',): ['pool degraded', 'scrub finished']}, routes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from models import Notification
+from notification_routing import NotificationRouter, RoutingConfig, RouteRule
+from tests.static_options_monitor import StaticOptionsMonitor
+
+
+def _notification(title: str) -> Notification:
+    return Notification(source='s', title=title, severity='info', message='m')
+
+
+class NotificationRouterTests(unittest.TestCase):
+    def test_routes_follow_configuration_changes(self):
+        config_monitor = StaticOptionsMonitor(RoutingConfig(enabled=True, routes={
+            'disks': RouteRule(publishers='telegram', title_pattern='disk')}))
+        router = NotificationRouter(config_monitor)
+        self.assertEqual(('telegram',), router.route(_notification('disk failed')))
+
+        config_monitor.set(RoutingConfig(enabled=True, routes={
+            'disks': RouteRule(publishers='gotify', title_pattern='disk')}))
+
+        self.assertEqual(('gotify',), router.route(_notification('disk failed')))
+        self.assertIsNone(router.route(_notification('pool degraded')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import asyncio
+import unittest
+
+from notification_delivery import RateLimiter, RateLimitConfig, RateLimitPolicy
+from notification_delivery.rate_limiter import TokenBucket
+from tests.static_options_monitor import StaticOptionsMonitor
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_refund_does_not_exceed_burst(self):
+        bucket = TokenBucket(RateLimitPolicy(rate=1, burst=2))
+
+        bucket.refund()
+
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertEqual(0.0, bucket.reserve())
+        self.assertGreater(bucket.reserve(), 0.0)
+
+
+class RateLimiterTests(unittest.IsolatedAsyncioTestCase):
+    async def test_cancelled_waiter_returns_its_token(self):
+        limiter = RateLimiter(StaticOptionsMonitor(
+            RateLimitConfig(publisher_limits={'p': RateLimitPolicy(rate=10, burst=1)}, destination_limits={})))
+        await limiter.acquire('p')
+        bucket = limiter._publisher_buckets['p']
+
+        waiters = [asyncio.create_task(limiter.acquire('p')) for _ in range(5)]
+        await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+
+        self.assertLessEqual(bucket.reserve(), 0.1 + 1e-3)
+
+    async def test_cancelled_waiter_does_not_delay_next_caller(self):
+        limiter = RateLimiter(StaticOptionsMonitor(
+            RateLimitConfig(publisher_limits={'p': RateLimitPolicy(rate=20, burst=1)}, destination_limits={})))
+        await limiter.acquire('p')
+
+        for _ in range(10):
+            waiter = asyncio.create_task(limiter.acquire('p'))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            await asyncio.gather(waiter, return_exceptions=True)
+
+        start_time = asyncio.get_running_loop().time()
+        await limiter.acquire('p')
+        self.assertLess(asyncio.get_running_loop().time() - start_time, 0.1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,9 @@
+from .configs import TracingConfig
+from .interfaces import ISpanExporter
+from .otlp_file_exporter import OtlpFileExporter
+from .ring_buffer_exporter import RingBufferExporter
+from .span import Span, NonRecordingSpan, get_current_span
+from .tracer import Tracer, get_tracer, set_tracer, start_trace, start_span
+
+__all__ = ('TracingConfig', 'ISpanExporter', 'OtlpFileExporter', 'RingBufferExporter', 'Span', 'NonRecordingSpan',
+           'get_current_span', 'Tracer', 'get_tracer', 'set_tracer', 'start_trace', 'start_span')
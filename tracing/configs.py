@@ -0,0 +1,8 @@
+from typing import NamedTuple
+
+
+class TracingConfig(NamedTuple):
+    sample_rate: float = 0.0
+    ring_buffer_size: int = 1024
+    otlp_file_path: str | None = None
+    service_name: str = 'notifications-server'
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from .span import Span
+
+
+class ISpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+    async def aclose(self) -> None:
+        ...
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import pathlib
+
+from .span import Span, AttributeValue
+
+
+class OtlpFileExporter:
+    def __init__(self, file_path: str, service_name: str, batch_size: int = 64):
+        self._file = pathlib.Path(file_path)
+        self._service_name = service_name
+        self._batch_size = batch_size
+        self._pending: list[Span] = []
+        self._writer: asyncio.Task | None = None
+
+    def export(self, span: Span) -> None:
+        self._pending.append(span)
+        if span.parent_id is None or len(self._pending) >= self._batch_size:
+            self._schedule_flush()
+
+    async def flush(self):
+        if self._writer is not None:
+            await self._writer
+        await self._write_pending()
+
+    async def aclose(self) -> None:
+        await self.flush()
+
+    def _schedule_flush(self):
+        if self._writer is not None and not self._writer.done():
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            spans, self._pending = self._pending, []
+            self._write(spans)
+            return
+
+        self._writer = loop.create_task(self._write_pending())
+
+    async def _write_pending(self):
+        while self._pending:
+            spans, self._pending = self._pending, []
+            try:
+                await asyncio.to_thread(self._write, spans)
+            except Exception as e:
+                print(f"Failed to write {len(spans)} span(s) to '{self._file}': {e}")
+
+    def _write(self, spans: list[Span]):
+        line = json.dumps(self._to_otlp_request(spans), separators=(',', ':'))
+        with open(self._file, 'a', encoding='utf-8') as fp:
+            fp.write(line + '\n')
+
+    def _to_otlp_request(self, spans: list[Span]) -> dict[str, object]:
+        return {'resourceSpans': [{
+            'resource': {'attributes': [_to_otlp_attribute('service.name', self._service_name)]},
+            'scopeSpans': [{'scope': {'name': 'notifications-server'},
+                            'spans': [_to_otlp_span(span) for span in spans]}],
+        }]}
+
+
+def _to_otlp_span(span: Span) -> dict[str, object]:
+    otlp_span: dict[str, object] = {
+        'traceId': f'{span.trace_id:032x}',
+        'spanId': f'{span.span_id:016x}',
+        'name': span.name,
+        'kind': 1,
+        'startTimeUnixNano': str(span.start_time),
+        'endTimeUnixNano': str(span.end_time),
+        'attributes': [_to_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        'status': {'code': 2, 'message': span.error} if span.error is not None else {'code': 1},
+    }
+    if span.parent_id is not None:
+        otlp_span['parentSpanId'] = f'{span.parent_id:016x}'
+
+    return otlp_span
+
+
+def _to_otlp_attribute(key: str, value: AttributeValue) -> dict[str, object]:
+    if isinstance(value, bool):
+        return {'key': key, 'value': {'boolValue': value}}
+    if isinstance(value, int):
+        return {'key': key, 'value': {'intValue': str(value)}}
+    if isinstance(value, float):
+        return {'key': key, 'value': {'doubleValue': value}}
+    return {'key': key, 'value': {'stringValue': str(value)}}
@@ -0,0 +1,39 @@
+import collections
+
+from .span import Span
+
+
+class RingBufferExporter:
+    def __init__(self, capacity: int = 1024):
+        self._spans: collections.deque[Span] = collections.deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        self._spans.append(span)
+
+    async def aclose(self) -> None:
+        pass
+
+    def get_traces(self) -> dict[str, list[dict[str, object]]]:
+        traces: dict[str, list[dict[str, object]]] = {}
+        for span in tuple(self._spans):
+            traces.setdefault(f'{span.trace_id:032x}', []).append(_span_to_dict(span))
+
+        for spans in traces.values():
+            spans.sort(key=lambda s: s['start_time'])
+
+        return traces
+
+    def clear(self):
+        self._spans.clear()
+
+
+def _span_to_dict(span: Span) -> dict[str, object]:
+    return {
+        'name': span.name,
+        'span_id': f'{span.span_id:016x}',
+        'parent_id': None if span.parent_id is None else f'{span.parent_id:016x}',
+        'start_time': span.start_time,
+        'duration_ms': round(span.duration * 1000, 3),
+        'attributes': span.attributes,
+        'error': span.error,
+    }
@@ -0,0 +1,77 @@
+import contextvars
+import time
+from typing import Callable, Self
+
+type AttributeValue = str | int | float | bool
+
+_current_span: contextvars.ContextVar['Span | None'] = contextvars.ContextVar('_current_span', default=None)
+
+
+def get_current_span() -> 'Span | None':
+    return _current_span.get()
+
+
+class Span:
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start_time', 'end_time', 'attributes', 'error',
+                 '_on_end', '_token')
+
+    def __init__(self, name: str, trace_id: int, span_id: int, parent_id: int | None,
+                 attributes: dict[str, AttributeValue] | None, on_end: Callable[['Span'], None]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.start_time = 0
+        self.end_time = 0
+        self.attributes: dict[str, AttributeValue] = attributes if attributes is not None else {}
+        self.error: str | None = None
+        self._on_end = on_end
+        self._token: contextvars.Token | None = None
+
+    @property
+    def is_recording(self) -> bool:
+        return True
+
+    @property
+    def duration(self) -> float:
+        return (self.end_time - self.start_time) / 1e9
+
+    def set_attribute(self, key: str, value: AttributeValue):
+        self.attributes[key] = value
+
+    def __enter__(self) -> Self:
+        self._token = _current_span.set(self)
+        self.start_time = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.end_time = time.time_ns()
+        if exc_val is not None:
+            self.error = f'{exc_type.__name__}: {exc_val}'
+
+        try:
+            _current_span.reset(self._token)
+        except ValueError:
+            _current_span.set(None)
+        self._token = None
+        self._on_end(self)
+
+
+class NonRecordingSpan:
+    __slots__ = ()
+
+    @property
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue):
+        pass
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+NON_RECORDING_SPAN = NonRecordingSpan()
@@ -0,0 +1,83 @@
+import random
+from typing import Sequence
+
+from .interfaces import ISpanExporter
+from .span import Span, NonRecordingSpan, NON_RECORDING_SPAN, AttributeValue, get_current_span
+
+
+class Tracer:
+    def __init__(self, sample_rate: float = 0.0, exporters: Sequence[ISpanExporter] = ()):
+        self._sample_rate = sample_rate
+        self._exporters = tuple(exporters)
+
+    @property
+    def enabled(self) -> bool:
+        return self._sample_rate > 0 and len(self._exporters) > 0
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, sample_rate: float):
+        self._sample_rate = sample_rate
+
+    def start_trace(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> Span | NonRecordingSpan:
+        if self._sample_rate <= 0 or not self._exporters:
+            return NON_RECORDING_SPAN
+
+        parent = get_current_span()
+        if parent is not None:
+            return Span(name, parent.trace_id, random.getrandbits(64), parent.span_id, attributes, self._export)
+        if self._sample_rate < 1 and random.random() >= self._sample_rate:
+            return NON_RECORDING_SPAN
+
+        return Span(name, random.getrandbits(128), random.getrandbits(64), None, attributes, self._export)
+
+    def start_span(self, name: str, attributes: dict[str, AttributeValue] | None = None) -> Span | NonRecordingSpan:
+        if self._sample_rate <= 0:
+            return NON_RECORDING_SPAN
+
+        parent = get_current_span()
+        if parent is None:
+            return NON_RECORDING_SPAN
+
+        return Span(name, parent.trace_id, random.getrandbits(64), parent.span_id, attributes, self._export)
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        for exporter in self._exporters:
+            await exporter.aclose()
+
+    def _export(self, span: Span):
+        for exporter in self._exporters:
+            try:
+                exporter.export(span)
+            except Exception as e:
+                print(f"Failed to export span '{span.name}': {e}")
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+def set_tracer(tracer: Tracer):
+    global _tracer
+    _tracer = tracer
+
+
+def start_trace(name: str, attributes: dict[str, AttributeValue] | None = None) -> Span | NonRecordingSpan:
+    if _tracer._sample_rate <= 0:
+        return NON_RECORDING_SPAN
+    return _tracer.start_trace(name, attributes)
+
+
+def start_span(name: str, attributes: dict[str, AttributeValue] | None = None) -> Span | NonRecordingSpan:
+    if _tracer._sample_rate <= 0:
+        return NON_RECORDING_SPAN
+    return _tracer.start_span(name, attributes)
@@ -1,5 +1,6 @@
+from .interfaces import IHostedService
 from .models import Endpoint
 from .web_application import WebApplication
 from .web_application_builder import WebApplicationBuilder
 
-__all__ = ('WebApplication', 'WebApplicationBuilder', 'Endpoint')
+__all__ = ('WebApplication', 'WebApplicationBuilder', 'Endpoint', 'IHostedService')
@@ -1,97 +1,132 @@
-import contextvars
-import dataclasses
+import functools
+import inspect
+import time
 from types import NoneType, UnionType
-from typing import Callable, Generator, Mapping, Self, Annotated, get_type_hints, final, Union
+from typing import Callable, Awaitable, Mapping, Self, Annotated, get_type_hints, Union
 from typing import get_origin, get_args, Sequence
 
 import typing_extensions
 from fastapi import Depends
+from starlette.concurrency import run_in_threadpool
 
-from dependency_injection import IServiceScopeFactory, IServiceScope, IServiceRegistrationHandler
-from .models import Endpoint
+from dependency_injection import IServiceProvider, IServiceRegistrationHandler, LifeScope
+from tracing import start_span
+from .models import Endpoint, EndpointFunctionType
+from .request_scopes import RequestScopes
 
+_INJECTED_SERVICES_PARAMETER = '_injected_services'
 
-@dataclasses.dataclass(eq=False, slots=True)
-class _RequestState:
-    di_scope: IServiceScope | None
-    counter: int = 0
 
+def _create_resolver(t: type) -> Callable[[IServiceProvider], object | Sequence[object]]:
+    origin = get_origin(t)
+    args = get_args(t)
+
+    if origin is None:
+        return lambda service_provider: service_provider.get_required_service(t)
+    if isinstance(origin, type) and issubclass(origin, Sequence):
+        elem_type = args[0]
+        if origin in (tuple, list):
+            return lambda service_provider: origin(service_provider.get_services(elem_type))
+        return lambda service_provider: service_provider.get_services(elem_type)
 
-@final
-class _RequestsHandler:
-    _request_state: contextvars.ContextVar[_RequestState] = contextvars.ContextVar('_request_state',
-                                                                                   default=_RequestState(None))
+    non_none_type = _get_service_type(t)
+    return lambda service_provider: service_provider.get_service(non_none_type)
 
-    def __init__(self, scope_factory: IServiceScopeFactory):
-        self._scope_factory = scope_factory
 
-    def get_scope(self) -> IServiceScope:
-        request_state = self._get_request_state()
-        scope = request_state.di_scope
+def _get_service_type(t: type) -> type:
+    origin = get_origin(t)
+    args = get_args(t)
+
+    if origin is None:
+        return t
+    if isinstance(origin, type) and issubclass(origin, Sequence):
+        return args[0]
 
-        return scope
+    return args[1] if args[0] is NoneType else args[0]
 
-    def on_request_started(self):
-        request_state = self._get_request_state()
-        request_state.counter += 1
-        _RequestsHandler._request_state.set(request_state)
 
-    def on_request_completed(self):
-        request_state = self._get_request_state()
-        request_state.counter -= 1
+def _inject(t: type, request_scopes: RequestScopes, singleton: bool) -> Callable[[], Awaitable[object]]:
+    resolve = _create_resolver(t)
+    resolve_duration = request_scopes.resolve_duration
 
-        if request_state.counter == 0:
-            self._dispose_scope(request_state)
+    if singleton:
+        async def singleton_dependency() -> object | Sequence[object]:
+            start_time = time.perf_counter()
+            with start_span('resolve services'):
+                service = resolve(request_scopes.root_service_provider)
+            resolve_duration.observe(time.perf_counter() - start_time)
+            return service
 
-        _RequestsHandler._request_state.set(request_state)
+        return singleton_dependency
 
-    def _dispose_scope(self, request_state: _RequestState):
-        request_state.di_scope.__exit__(None, None, None)
-        request_state.di_scope = None
+    async def dependency() -> object | Sequence[object]:
+        start_time = time.perf_counter()
+        with start_span('resolve services'):
+            scope = await request_scopes.get_scope()
+            service = resolve(scope.service_provider)
+        resolve_duration.observe(time.perf_counter() - start_time)
+        return service
 
-    def _get_request_state(self) -> _RequestState:
-        request_state = _RequestsHandler._request_state.get()
-        if request_state.di_scope is None:
-            scope = self._scope_factory.create_scope().__enter__()
-            request_state.di_scope = scope
-            _RequestsHandler._request_state.set(request_state)
+    return dependency
 
-        return request_state
 
+def _inject_all(types: Sequence[type], request_scopes: RequestScopes,
+                singleton: bool) -> Callable[[], Awaitable[list[object]]]:
+    resolvers = tuple(_create_resolver(t) for t in types)
+    resolve_duration = request_scopes.resolve_duration
 
-def _inject(t: type, request_handler: _RequestsHandler) -> Callable[[], Generator[object, None, None]]:
-    origin = get_origin(t)
-    args = get_args(t)
+    if singleton:
+        async def singleton_dependencies() -> list[object]:
+            start_time = time.perf_counter()
+            with start_span('resolve services'):
+                service_provider = request_scopes.root_service_provider
+                services = [resolve(service_provider) for resolve in resolvers]
+            resolve_duration.observe(time.perf_counter() - start_time)
+            return services
 
-    def dependency() -> Generator[object | Sequence[object], None, None]:
-        scope = request_handler.get_scope()
-        try:
-            request_handler.on_request_started()
-            if origin is None:
-                yield scope.service_provider.get_required_service(t)
-            elif issubclass(origin, Sequence):
-                elem_type = args[0]
-                services = scope.service_provider.get_services(elem_type)
-                yield origin(services) if origin in (tuple, list) else services
-            elif origin in (Union, UnionType):
-                non_none_type = args[0] if args[1] is NoneType else args[0]
-                yield scope.service_provider.get_service(non_none_type)
-        finally:
-            request_handler.on_request_completed()
+        return singleton_dependencies
 
-    return dependency
+    async def dependencies() -> list[object]:
+        start_time = time.perf_counter()
+        with start_span('resolve services'):
+            service_provider = (await request_scopes.get_scope()).service_provider
+            services = [resolve(service_provider) for resolve in resolvers]
+        resolve_duration.observe(time.perf_counter() - start_time)
+        return services
+
+    return dependencies
+
+
+def _with_injected_services(function: EndpointFunctionType, names: Sequence[str],
+                            signature: inspect.Signature) -> EndpointFunctionType:
+    span_name = f'endpoint {function.__name__}'
+
+    if inspect.iscoroutinefunction(function):
+        async def endpoint(**kwargs):
+            kwargs.update(zip(names, kwargs.pop(_INJECTED_SERVICES_PARAMETER)))
+            with start_span(span_name):
+                return await function(**kwargs)
+    else:
+        async def endpoint(**kwargs):
+            kwargs.update(zip(names, kwargs.pop(_INJECTED_SERVICES_PARAMETER)))
+            with start_span(span_name):
+                return await run_in_threadpool(function, **kwargs)
+
+    functools.update_wrapper(endpoint, function)
+    endpoint.__signature__ = signature
+    return endpoint
 
 
 class EndpointHandlerBuilder:
-    def __init__(self, endpoint: Endpoint, scope_factory: IServiceScopeFactory,
+    def __init__(self, endpoint: Endpoint, request_scopes: RequestScopes,
                  di_registration_handler: IServiceRegistrationHandler,
                  add_endpoint_callback: Callable[[Endpoint], None]):
         self._endpoint = endpoint
-        self._request_handler = _RequestsHandler(scope_factory)
+        self._request_scopes = request_scopes
         self._di_registration_handler = di_registration_handler
         self._add_endpoint_callback = add_endpoint_callback
 
-    def with_dependencies(self, types_override: Mapping[str, type] = None) -> Self:
+    def with_dependencies(self, types_override: Mapping[str, type] = None, single_injector: bool = False) -> Self:
         function_annotations = get_type_hints(self._endpoint.function, include_extras=True)
         updated_annotations: dict[str, type] = {name: ann for name, ann in function_annotations.items()
                                                 if self._is_di_injectable(ann)}
@@ -100,10 +135,14 @@ class EndpointHandlerBuilder:
             updated_annotations.update({name: t for name, t in types_override.items()
                                         if name in function_annotations.keys()})
 
+        if single_injector:
+            self._inject_with_single_dependency(function_annotations, updated_annotations)
+            return self
+
         for param_name, t in updated_annotations.items():
             function_annotations[param_name] = Annotated[
                 t,
-                Depends(_inject(t, self._request_handler), use_cache=False)
+                Depends(_inject(t, self._request_scopes, self._is_singleton(t)), use_cache=False)
             ]
 
         self._endpoint.function.__annotations__ = function_annotations
@@ -112,6 +151,23 @@ class EndpointHandlerBuilder:
     def apply(self):
         self._add_endpoint_callback(self._endpoint)
 
+    def _inject_with_single_dependency(self, function_annotations: Mapping[str, type],
+                                       injected_annotations: Mapping[str, type]):
+        function = self._endpoint.function
+        signature = inspect.signature(function)
+        singleton = all(self._is_singleton(t) for t in injected_annotations.values())
+        dependency = Depends(_inject_all(tuple(injected_annotations.values()), self._request_scopes, singleton),
+                             use_cache=False)
+
+        parameters = [parameter.replace(annotation=function_annotations.get(name, parameter.annotation))
+                      for name, parameter in signature.parameters.items() if name not in injected_annotations]
+        parameters.append(inspect.Parameter(_INJECTED_SERVICES_PARAMETER, inspect.Parameter.KEYWORD_ONLY,
+                                            annotation=Annotated[list[object], dependency]))
+
+        endpoint_signature = signature.replace(parameters=parameters)
+        endpoint = _with_injected_services(function, tuple(injected_annotations), endpoint_signature)
+        self._endpoint = self._endpoint._replace(function=endpoint)
+
     def _is_di_injectable(self, annotation: type) -> bool:
         origin = get_origin(annotation)
         args = get_args(annotation)
@@ -130,5 +186,10 @@ class EndpointHandlerBuilder:
 
         return False
 
+    def _is_singleton(self, annotation: type) -> bool:
+        t = _get_service_type(annotation)
+        registered_services = self._di_registration_handler.get_registered_services_data(t)
+        return all(service.life_scope is LifeScope.Singleton for service in registered_services)
+
     def _is_registered(self, t: type) -> bool:
         return isinstance(t, type) and self._di_registration_handler.is_service_registered(t)
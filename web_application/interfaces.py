@@ -0,0 +1,9 @@
+from typing import Protocol
+
+
+class IHostedService(Protocol):
+    async def start(self) -> None:
+        ...
+
+    async def stop(self) -> None:
+        ...
@@ -0,0 +1,94 @@
+import contextvars
+import dataclasses
+from typing import AsyncContextManager, final
+
+from starlette.types import ASGIApp, Scope, Receive, Send
+
+from dependency_injection import IServiceScope, IServiceProvider, IDependencyContainer
+from metrics import MetricsRegistry, HistogramValue, GaugeValue
+from tracing import start_trace
+
+_RESOLVE_DURATION_BUCKETS = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01)
+
+
+@dataclasses.dataclass(eq=False, slots=True)
+class _RequestState:
+    scope_context: AsyncContextManager[IServiceScope] | None = None
+    di_scope: IServiceScope | None = None
+
+
+@final
+class RequestScopes:
+    _request_state: contextvars.ContextVar[_RequestState] = contextvars.ContextVar('_request_state')
+
+    def __init__(self, di_container: IDependencyContainer, metrics: MetricsRegistry, pool_size: int = 32):
+        self._di_container = di_container
+        self._pool_size = pool_size
+        self._pool: list[_RequestState] = []
+        self._resolve_duration = metrics.histogram('di_resolve_duration_seconds',
+                                                   'Time spent resolving the services injected into an endpoint',
+                                                   buckets=_RESOLVE_DURATION_BUCKETS).labels()
+        self._requests_in_flight = metrics.gauge('http_requests_in_flight',
+                                                 'HTTP requests currently being handled').labels()
+
+    @property
+    def root_service_provider(self) -> IServiceProvider:
+        return self._di_container.service_provider
+
+    @property
+    def resolve_duration(self) -> HistogramValue:
+        return self._resolve_duration
+
+    @property
+    def requests_in_flight(self) -> GaugeValue:
+        return self._requests_in_flight
+
+    async def get_scope(self) -> IServiceScope:
+        request_state = RequestScopes._request_state.get()
+        if request_state.di_scope is None:
+            scope_context = self._di_container.create_async_scope()
+            request_state.di_scope = await scope_context.__aenter__()
+            request_state.scope_context = scope_context
+
+        return request_state.di_scope
+
+    def begin_request(self) -> tuple[_RequestState, contextvars.Token[_RequestState]]:
+        request_state = self._pool.pop() if self._pool else _RequestState()
+        return request_state, RequestScopes._request_state.set(request_state)
+
+    async def end_request(self, request_state: _RequestState, token: contextvars.Token[_RequestState]):
+        RequestScopes._request_state.reset(token)
+        scope_context = request_state.scope_context
+        request_state.scope_context = None
+        request_state.di_scope = None
+
+        if len(self._pool) < self._pool_size:
+            self._pool.append(request_state)
+
+        if scope_context is not None:
+            await scope_context.__aexit__(None, None, None)
+
+
+@final
+class RequestScopeMiddleware:
+    def __init__(self, app: ASGIApp, request_scopes: RequestScopes):
+        self._app = app
+        self._request_scopes = request_scopes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope['type'] != 'http':
+            await self._app(scope, receive, send)
+            return
+
+        requests_in_flight = self._request_scopes.requests_in_flight
+        requests_in_flight.inc()
+        request_state, token = self._request_scopes.begin_request()
+        try:
+            with start_trace('http request') as span:
+                if span.is_recording:
+                    span.set_attribute('http.method', scope['method'])
+                    span.set_attribute('http.target', scope['path'])
+                await self._app(scope, receive, send)
+        finally:
+            await self._request_scopes.end_request(request_state, token)
+            requests_in_flight.dec()
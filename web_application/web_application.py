@@ -2,14 +2,22 @@ import uvicorn
 from fastapi import FastAPI
 
 from dependency_injection import IDependencyContainer
+from metrics import MetricsRegistry
 from .endpoint_handler_builder import EndpointHandlerBuilder
+from .interfaces import IHostedService
 from .models import Endpoint, Method, EndpointFunctionType
+from .request_scopes import RequestScopes, RequestScopeMiddleware
 
 
 class WebApplication:
-    def __init__(self, di_container: IDependencyContainer):
+    def __init__(self, di_container: IDependencyContainer, metrics: MetricsRegistry, shutdown_timeout: float = 10.0):
         self._di_container = di_container
-        self._app = FastAPI(on_shutdown=[self._di_container.dispose])
+        self._shutdown_timeout = shutdown_timeout
+        self._hosted_services: list[IHostedService] = []
+        self._app = FastAPI(on_startup=[self._di_container.initialize, self._start_hosted_services],
+                            on_shutdown=[self._stop_hosted_services, self._dispose_services])
+        self._request_scopes = RequestScopes(di_container, metrics)
+        self._app.add_middleware(RequestScopeMiddleware, request_scopes=self._request_scopes)
 
     def map_get(self, route: str, function: EndpointFunctionType) -> EndpointHandlerBuilder:
         return self._map(route, function, Method.Get)
@@ -38,9 +46,24 @@ class WebApplication:
     def run(self, host: str = "0.0.0.0", port: int = 8000):
         uvicorn.run(self._app, host=host, port=port)
 
+    async def _start_hosted_services(self):
+        async with self._di_container.create_async_scope() as scope:
+            self._hosted_services = list(scope.service_provider.get_services(IHostedService))
+
+        for hosted_service in self._hosted_services:
+            await hosted_service.start()
+
+    async def _stop_hosted_services(self):
+        for hosted_service in reversed(self._hosted_services):
+            await hosted_service.stop()
+        self._hosted_services.clear()
+
+    async def _dispose_services(self):
+        await self._di_container.aclose(self._shutdown_timeout)
+
     def _map(self, route: str, function: EndpointFunctionType, method: Method) -> EndpointHandlerBuilder:
         endpoint = Endpoint(route, method, function)
-        return EndpointHandlerBuilder(endpoint, self._di_container, self._di_container, self._register_endpoint)
+        return EndpointHandlerBuilder(endpoint, self._request_scopes, self._di_container, self._register_endpoint)
 
     def _register_endpoint(self, endpoint: Endpoint) -> None:
         self._app.add_api_route(endpoint.route, endpoint.function, methods=[endpoint.method])
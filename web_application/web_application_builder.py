@@ -1,5 +1,7 @@
-from configuration import ConfigurationContainerBuilder
+from configuration import ConfigurationContainerBuilder, ConfigurationWatcher
 from dependency_injection import DependencyContainerBuilder
+from metrics import MetricsRegistry
+from .interfaces import IHostedService
 from .web_application import WebApplication
 
 
@@ -7,6 +9,13 @@ class WebApplicationBuilder:
     def __init__(self):
         self._di_container_builder = DependencyContainerBuilder()
         self._config_container_builder = ConfigurationContainerBuilder(self._di_container_builder)
+        self._metrics = MetricsRegistry()
+        self._di_container_builder.add_singleton(MetricsRegistry, instantiation_method=lambda _: self._metrics)
+        self._config_container_builder.add_reload_listener(
+            self._metrics.counter('configuration_reloads', 'Configuration reloads').labels().inc)
+        self._di_container_builder.add_singleton(
+            IHostedService, ConfigurationWatcher,
+            lambda service_provider: service_provider.get_required_service(ConfigurationWatcher))
 
     @property
     def services(self) -> DependencyContainerBuilder:
@@ -16,5 +25,9 @@ class WebApplicationBuilder:
     def configuration(self) -> ConfigurationContainerBuilder:
         return self._config_container_builder
 
-    def build(self) -> WebApplication:
-        return WebApplication(self._di_container_builder.build())
+    @property
+    def metrics(self) -> MetricsRegistry:
+        return self._metrics
+
+    def build(self, validate: bool = False, shutdown_timeout: float = 10.0) -> WebApplication:
+        return WebApplication(self._di_container_builder.build(validate), self._metrics, shutdown_timeout)